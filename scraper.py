@@ -1,721 +1,1393 @@
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from datetime import datetime, date, timezone
+from email.utils import parsedate_to_datetime
 import argparse
 import time
 import random
-
-def make_request(url, max_retries=3, delay=2):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3',
-        'Connection': 'keep-alive',
-        'Cache-Control': 'no-cache',
-        'Pragma': 'no-cache',
-    }
-
-    for attempt in range(max_retries):
+import os
+import json
+import csv
+import xml.etree.ElementTree as ET
+import hashlib
+import mimetypes
+import sqlite3
+import threading
+import tracemalloc
+import tomllib
+import re
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from html import escape
+from urllib.parse import urlparse, urlunparse, urldefrag, parse_qsl, urlencode
+
+# Nombre maximum de sections récupérées en même temps, tous sites confondus
+MAX_WORKERS = 8
+
+# Nombre maximum de requêtes HTTP en cours en même temps sur un même site
+HOST_CONCURRENCY = {
+    'www.zataz.com': 3,
+    'www.it-connect.fr': 4,
+}
+DEFAULT_HOST_CONCURRENCY = 2
+
+# Moteurs d'analyse HTML utilisables par BeautifulSoup ('auto' choisit lxml s'il est installé)
+PARSER_BACKENDS = ('auto', 'lxml', 'html.parser', 'html5lib')
+DEFAULT_PARSER_BACKEND = 'auto'
+parser_backend = 'html.parser'
+
+# Seuls les conteneurs lus par chaque scraper sont construits lors de l'analyse :
+# en-têtes, menus, barres latérales et scripts ne sont jamais transformés en arbre
+def has_class(name):
+    # Selon la version de bs4, SoupStrainer compare l'attribut class complet ("post-12 post type-post")
+    # ou chacune de ses valeurs : on découpe nous-mêmes pour obtenir le même résultat que find_all
+    def match(value):
+        if not value:
+            return False
+        if isinstance(value, str):
+            value = value.split()
+        return name in value
+    return match
+
+ZATAZ_STRAINER = SoupStrainer('div', class_=has_class('blog-context-wrapper'))
+OSINT_STRAINER = SoupStrainer('iframe', class_=has_class('wp-embedded-content'))
+EMBED_STRAINER = SoupStrainer('div', class_=lambda x: x and 'wp-embed post-' in x)
+
+# Pagination WordPress (/page/N/) : nombre de pages d'une même section récupérées en même temps
+PAGE_WORKERS = 3
+
+# Nombre de pages intégrées (iframes OSINT) récupérées en même temps
+EMBED_WORKERS = 4
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+# Paramètres du client HTTP partagé par tous les scrapers
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+}
+
+# Débit autorisé par site : nombre de requêtes par seconde et rafale maximale
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 5
+
+class RateLimiter:
+    # Seau à jetons par site : une requête part immédiatement s'il reste un jeton,
+    # sinon elle attend seulement le temps nécessaire pour en récupérer un.
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        if self.rate <= 0:
+            return 0
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate) - 1
+            self._buckets[host] = (tokens, now)
+        # Un solde négatif réserve le jeton : les requêtes en attente passent chacune à leur tour
+        wait = -tokens / self.rate if tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+# Nouvelles tentatives : nombre maximum, attente de base (doublée à chaque essai) et plafond
+# d'une attente, temps total maximum passé à attendre pour une même requête (en secondes)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 10
+DEFAULT_RETRY_BUDGET = 30
+
+# Réponses d'un serveur momentanément indisponible ou surchargé, qui méritent un nouvel essai.
+# Les autres erreurs (404, 403...) ne changeront pas en réessayant.
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+class RetryPolicy:
+    # Décide si une requête ratée doit être relancée et combien de temps attendre avant :
+    # Retry-After si le serveur l'indique, sinon attente exponentielle avec gigue (« full jitter »)
+    # pour que les requêtes en échec ne repartent pas toutes au même instant.
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF,
+                 budget=DEFAULT_RETRY_BUDGET):
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+
+    def retryable_status(self, status_code):
+        return status_code in RETRY_STATUSES
+
+    def retryable_error(self, error):
+        # Coupure réseau ou délai dépassé ; une URL invalide ou un trop grand nombre de redirections
+        # échoueront de la même façon au prochain essai
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                  requests.exceptions.ChunkedEncodingError))
+
+    def wait(self, attempt, response=None):
+        retry_after = self.retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def retry_after(self, response):
+        # Retry-After : un nombre de secondes ou une date HTTP
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
         try:
-            # Ajouter un délai aléatoire entre les requêtes
-            time.sleep(delay + random.uniform(0, 2))
-            
-            response = requests.get(
-                url, 
-                headers=headers,
-                timeout=10,
-                verify=True
-            )
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:  # Dernière tentative
-                raise e
-            time.sleep(delay * (attempt + 1))  # Délai croissant entre les tentatives
-            continue
-
-def scrape_zataz_section(url, section_type):
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+# Disjoncteur par site : nombre d'échecs consécutifs avant de suspendre les requêtes vers ce site,
+# et durée (en secondes) de la suspension avant une requête d'essai
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    # Requête refusée sans être envoyée : le site est considéré comme indisponible
+    pass
+
+class CircuitBreaker:
+    # Après failure_threshold échecs consécutifs (coupure, délai dépassé, erreur 5xx) sur un site,
+    # les requêtes suivantes vers ce site échouent immédiatement. Passé reset_timeout, une seule
+    # requête d'essai est autorisée : si elle réussit le site est rétabli, sinon il reste suspendu.
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, url):
+        if self.failure_threshold <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state['opened_at'] is None:
+                return
+            if state['probing'] or time.monotonic() - state['opened_at'] < self.reset_timeout:
+                raise CircuitOpenError(f"Site {host} indisponible, requête non envoyée : {url}")
+            state['probing'] = True
+
+    def record_success(self, url):
+        with self._lock:
+            self._hosts.pop(urlparse(url).netloc, None)
+
+    def record_failure(self, url):
+        if self.failure_threshold <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            state = self._hosts.setdefault(host, {'failures': 0, 'opened_at': None, 'probing': False})
+            state['failures'] += 1
+            if state['probing'] or (state['opened_at'] is None and state['failures'] >= self.failure_threshold):
+                if state['opened_at'] is None:
+                    print(f"Site {host} indisponible : requêtes suspendues pendant {self.reset_timeout:g} s")
+                state['opened_at'] = time.monotonic()
+                state['probing'] = False
+
+    def is_failure(self, response=None, error=None):
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return response.status_code >= 500
+
+# Dossier du cache disque (réponses HTTP et articles déjà analysés)
+DEFAULT_CACHE_DIR = '.scraper_cache'
+
+def write_atomically(path, write, mode='w', **kwargs):
+    # write(f) écrit dans un fichier temporaire, renommé ensuite : un lecteur ne voit jamais un fichier
+    # à moitié écrit et un export interrompu n'écrase pas le précédent. Le nom temporaire est propre
+    # au thread (deux threads peuvent écrire le même fichier) et supprimé si l'écriture échoue.
+    if 'b' not in mode:
+        kwargs.setdefault('encoding', 'utf-8')
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        if section_type in ['cybersecurity', 'darkweb']:
-            # Pour la section cybersécurité ou darknet
-            items = soup.find_all('div', class_='blog-context-wrapper')
-            for item in items:
-                titre_element = item.find('h2', class_='blog-title')
-                if titre_element and titre_element.find('a'):
-                    lien_element = titre_element.find('a')
-                    titre = lien_element.text.strip()
-                    lien = lien_element['href']
-                else:
-                    titre = "Titre non disponible"
-                    lien = "#"
-                
-                contenu_element = item.find('div', class_='blog-content')
-                contenu = contenu_element.text.strip() if contenu_element else "Contenu non disponible"
-                articles.append({'titre': titre, 'lien': lien, 'contenu': contenu, 'category': section_type})
-
-        elif section_type == 'osint':
-            # Pour la section OSINT avec gestion des iframes
-            iframes = soup.find_all('iframe', class_='wp-embedded-content')
-            for iframe in iframes:
-                # Récupérer l'URL source de l'iframe
-                src = iframe.get('src', '')
-                if src:
-                    try:
-                        # Récupérer le contenu de l'iframe
-                        article_response = requests.get(src)
-                        article_response.raise_for_status()
-                        article_soup = BeautifulSoup(article_response.text, 'html.parser')
-                        
-                        # Trouver le div principal de l'article dans l'iframe
-                        article_div = article_soup.find('div', class_=lambda x: x and 'wp-embed post-' in x)
-                        if article_div:
-                            # Récupérer le titre et le lien depuis wp-embed-heading
-                            heading = article_div.find('p', class_='wp-embed-heading')
-                            if heading and heading.find('a'):
-                                lien_element = heading.find('a')
-                                titre = lien_element.text.strip()
-                                # Enlever '/embed/' de l'URL
-                                lien = lien_element['href'].replace('/embed/', '/')
-                            else:
-                                titre = "Titre non disponible"
-                                lien = "#"
-                            
-                            # Récupérer le contenu depuis wp-embed-excerpt
-                            excerpt = article_div.find('div', class_='wp-embed-excerpt')
-                            if excerpt and excerpt.find('p'):
-                                contenu = excerpt.find('p').text.strip()
-                            else:
-                                contenu = "Contenu non disponible"
-                            
-                            articles.append({
-                                'titre': titre,
-                                'lien': lien,
-                                'contenu': contenu,
-                                'category': 'osint'
-                            })
-                    except Exception as e:
-                        print(f"Erreur lors de la récupération de l'article {src}: {str(e)}")
-                        continue
+        with open(tmp_path, mode, **kwargs) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class HttpCache:
+    # Cache disque des pages avec leurs validateurs (ETag / Last-Modified).
+    # À la requête suivante, on envoie If-None-Match / If-Modified-Since et, sur un 304,
+    # on réutilise le corps enregistré ainsi que les articles déjà extraits de cette page.
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = os.path.join(directory, 'http')
+        os.makedirs(self.directory, exist_ok=True)
+        self._embeds_path = os.path.join(directory, 'embeds.json')
+        self._embeds = None
+        self._embeds_lock = threading.Lock()
+
+    def _path(self, url, suffix):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+
+    def load(self, url):
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(self._path(url, '.body'), 'rb') as f:
+                entry['body'] = f.read()
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def validators(self, entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        write_atomically(self._path(url, '.body'), lambda f: f.write(response.content), 'wb')
+        write_atomically(self._path(url, '.json'), lambda f: json.dump({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding,
+            'content_type': response.headers.get('Content-Type'),
+        }, f))
+
+    def cached_response(self, url, entry, not_modified):
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response.request = not_modified.request
+        response.headers = not_modified.headers
+        for header, field in (('ETag', 'etag'), ('Last-Modified', 'last_modified'), ('Content-Type', 'content_type')):
+            if entry.get(field):
+                response.headers.setdefault(header, entry[field])
+        response.encoding = entry.get('encoding')
+        response._content = entry['body']
+        response.from_cache = True
+        return response
+
+    def load_articles(self, url, key, response):
+        try:
+            with open(self._path(url, '.articles.json'), encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Les articles ne sont valables que pour la version de la page dont ils ont été extraits
+        if saved.get('etag') != response.headers.get('ETag') or saved.get('last_modified') != response.headers.get('Last-Modified'):
+            return None
+        return saved['articles'].get(key)
+
+    def store_articles(self, url, key, response, articles):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        path = self._path(url, '.articles.json')
+        try:
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        if saved.get('etag') != etag or saved.get('last_modified') != last_modified:
+            saved = {'etag': etag, 'last_modified': last_modified, 'articles': {}}
+        saved['articles'][key] = articles
+        write_atomically(path, lambda f: json.dump(saved, f, ensure_ascii=False))
+
+    def _load_embeds(self):
+        if self._embeds is None:
+            try:
+                with open(self._embeds_path, encoding='utf-8') as f:
+                    self._embeds = json.load(f)
+            except (OSError, ValueError):
+                self._embeds = {}
+        return self._embeds
+
+    def load_embed(self, url):
+        with self._embeds_lock:
+            return self._load_embeds().get(url)
+
+    def store_embed(self, url, article):
+        with self._embeds_lock:
+            embeds = self._load_embeds()
+            embeds[url] = article
+            write_atomically(self._embeds_path, lambda f: json.dump(embeds, f, ensure_ascii=False))
+
+class HttpClient:
+    # Une session requests par site : les connexions TCP/TLS sont réutilisées
+    # d'une requête à l'autre au lieu d'être rouvertes à chaque page.
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, headers=None, rate_limiter=None,
+                 cache=None, retry_policy=None, circuit_breaker=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def session(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url, use_cache=True, **kwargs):
+        # use_cache=False : réponse ni validée ni conservée par le cache HTTP (images, qui ont leur propre cache).
+        # Toutes les requêtes passent par la même politique de nouvelles tentatives. Une fois les essais
+        # ou le budget de temps épuisés, la dernière réponse est renvoyée (ou la dernière erreur levée).
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.budget
+        attempt = 0
+        while True:
+            error = response = None
+            try:
+                response = self._send(url, use_cache, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not policy.retryable_error(e):
+                    raise
+                error = e
+                wait = policy.wait(attempt)
+            else:
+                if not policy.retryable_status(response.status_code):
+                    return response
+                wait = policy.wait(attempt, response)
+            attempt += 1
+            # Inutile d'attendre si le prochain essai dépasserait le budget : on échoue tout de suite
+            if attempt > policy.max_retries or time.monotonic() + wait > deadline:
+                if error is not None:
+                    raise error
+                return response
+            metrics.add('retries')
+            time.sleep(wait)
+
+    def _send(self, url, use_cache=True, **kwargs):
+        # Une tentative, refusée d'emblée si le disjoncteur du site est ouvert
+        breaker = self.circuit_breaker
+        breaker.before_request(url)
+        try:
+            response = self._get_once(url, use_cache, **kwargs)
+        except requests.exceptions.RequestException as e:
+            metrics.record_request()
+            if breaker.is_failure(error=e):
+                breaker.record_failure(url)
+            else:
+                breaker.record_success(url)
+            raise
+        except Exception:
+            # Erreur locale (écriture du cache...) : comptée comme un échec, pour qu'une requête
+            # d'essai ne laisse jamais le disjoncteur bloqué dans l'état « essai en cours »
+            metrics.record_request()
+            breaker.record_failure(url)
+            raise
+        metrics.record_request(response)
+        if breaker.is_failure(response):
+            breaker.record_failure(url)
+        else:
+            breaker.record_success(url)
+        return response
+
+    def _get_once(self, url, use_cache=True, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        cache = self.cache if use_cache else None
+        entry = cache.load(url) if cache else None
+        if entry:
+            kwargs['headers'] = {**kwargs.get('headers', {}), **cache.validators(entry)}
+        # L'attente du limiteur de débit est comptée à part : fetch_seconds ne mesure que le réseau.
+        # Une place du site (host_semaphore) n'est occupée que le temps de la requête : l'analyse de la
+        # page se fait ensuite, pendant que d'autres threads téléchargent.
+        metrics.add('rate_wait_seconds', self.rate_limiter.acquire(url))
+        with host_semaphore(url), metrics.timer('fetch_seconds'):
+            response = self.session(url).get(url, **kwargs)
+        if entry and response.status_code == 304:
+            return cache.cached_response(url, entry, response)
+        response.from_cache = False
+        if cache and response.status_code == 200:
+            cache.store(url, response)
+        return response
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+http_client = HttpClient()
+
+def configure_http_client(pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, headers=None,
+                          rate=DEFAULT_RATE, burst=DEFAULT_BURST, cache_dir=DEFAULT_CACHE_DIR,
+                          max_retries=DEFAULT_MAX_RETRIES, retry_budget=DEFAULT_RETRY_BUDGET,
+                          failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+    global http_client
+    http_client.close()
+    cache = HttpCache(cache_dir) if cache_dir else None
+    http_client = HttpClient(pool_size, timeout, headers, RateLimiter(rate, burst), cache,
+                             RetryPolicy(max_retries, budget=retry_budget),
+                             CircuitBreaker(failure_threshold, reset_timeout))
+    return http_client
+
+# Compteurs relevés pour chaque section, dans l'ordre des colonnes du résumé
+METRIC_COUNTERS = ('requests', 'cache_hits', 'bytes', 'fetch_seconds', 'rate_wait_seconds', 'retries',
+                   'parse_seconds', 'articles', 'errors')
+
+METRIC_HELP = {
+    'requests': 'Requêtes HTTP envoyées',
+    'cache_hits': 'Pages inchangées servies par le cache (304)',
+    'bytes': 'Octets reçus',
+    'fetch_seconds': 'Temps passé à attendre les réponses HTTP',
+    'rate_wait_seconds': 'Temps passé à attendre le limiteur de débit avant d\'envoyer les requêtes',
+    'retries': 'Nouvelles tentatives après une erreur temporaire',
+    'parse_seconds': "Temps passé à analyser le HTML",
+    'articles': 'Articles extraits',
+    'errors': 'Erreurs rencontrées',
+}
+
+class Metrics:
+    # Mesures d'une exécution, par section. La section en cours est propre à chaque thread :
+    # les requêtes et analyses faites pendant metrics.section(nom) lui sont attribuées.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.sections = {}
+            self.render_seconds = {}
+
+    @contextmanager
+    def section(self, name):
+        previous = getattr(self._local, 'section', None)
+        self._local.section = name
+        try:
+            yield
+        finally:
+            self._local.section = previous
+
+    def current_section(self):
+        return getattr(self._local, 'section', None)
+
+    def bind(self, func):
+        # Pour les threads lancés depuis une section (pages intégrées OSINT) : même section qu'ici
+        section = self.current_section()
+        def run(*args, **kwargs):
+            with self.section(section):
+                return func(*args, **kwargs)
+        return run
+
+    def add(self, counter, value=1, section=None):
+        section = section or self.current_section()
+        if section is None:
+            return
+        with self._lock:
+            counters = self.sections.get(section)
+            if counters is None:
+                counters = self.sections[section] = dict.fromkeys(METRIC_COUNTERS, 0)
+            counters[counter] += value
+
+    @contextmanager
+    def timer(self, counter):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(counter, time.perf_counter() - start)
+
+    def record_request(self, response=None):
+        self.add('requests')
+        if response is None:
+            return
+        if getattr(response, 'from_cache', False):
+            self.add('cache_hits')
+        else:
+            self.add('bytes', len(response.content))
+
+    def record_render(self, output_format, elapsed):
+        with self._lock:
+            self.render_seconds[output_format] = self.render_seconds.get(output_format, 0) + elapsed
+
+    def print_summary(self, order=()):
+        names = [name for name in order if name in self.sections]
+        names += [name for name in self.sections if name not in names]
+        print(f"{'Section':<15}{'Requêtes':>9}{'Cache':>7}{'Ko':>9}{'Réseau (s)':>12}{'Attente (s)':>13}{'Relances':>10}"
+              f"{'Analyse (s)':>13}{'Articles':>10}{'Erreurs':>9}")
+        for name in names:
+            c = self.sections[name]
+            print(f"{name:<15}{c['requests']:>9}{c['cache_hits']:>7}{c['bytes'] / 1024:>9.1f}"
+                  f"{c['fetch_seconds']:>12.2f}{c['rate_wait_seconds']:>13.2f}{c['retries']:>10}{c['parse_seconds']:>13.3f}"
+                  f"{c['articles']:>10}{c['errors']:>9}")
+        for output_format, elapsed in self.render_seconds.items():
+            print(f"Écriture {output_format} : {elapsed:.3f} s")
+        print(f"Durée totale : {time.time() - self.started:.2f} s")
+
+    def to_dict(self):
+        return {
+            'started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+            'duration_seconds': time.time() - self.started,
+            'sections': self.sections,
+            'render_seconds': self.render_seconds,
+        }
 
+    def to_prometheus(self):
+        # Format textfile du node_exporter : une jauge par compteur, étiquetée par section
+        lines = []
+        for counter in METRIC_COUNTERS:
+            name = f'scraper_section_{counter}'
+            lines.append(f'# HELP {name} {METRIC_HELP[counter]}')
+            lines.append(f'# TYPE {name} gauge')
+            for section, counters in self.sections.items():
+                lines.append(f'{name}{{section="{prometheus_label(section)}"}} {counters[counter]:g}')
+        lines.append("# HELP scraper_render_seconds Temps d'écriture de chaque format de sortie")
+        lines.append('# TYPE scraper_render_seconds gauge')
+        for output_format, elapsed in self.render_seconds.items():
+            lines.append(f'scraper_render_seconds{{format="{prometheus_label(output_format)}"}} {elapsed:g}')
+        lines.append("# HELP scraper_run_duration_seconds Durée de la dernière exécution")
+        lines.append('# TYPE scraper_run_duration_seconds gauge')
+        lines.append(f'scraper_run_duration_seconds {time.time() - self.started:g}')
+        lines.append("# HELP scraper_last_run_timestamp_seconds Début de la dernière exécution")
+        lines.append('# TYPE scraper_last_run_timestamp_seconds gauge')
+        lines.append(f'scraper_last_run_timestamp_seconds {self.started:.0f}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        # .json : document JSON ; sinon fichier texte Prometheus (.prom pour le node_exporter)
+        if path.endswith('.json'):
+            data = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        else:
+            data = self.to_prometheus()
+        write_atomically(path, lambda f: f.write(data))
+
+def prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+metrics = Metrics()
+
+@dataclass(slots=True, kw_only=True)
+class Article:
+    # Un article, quelle que soit la section qui l'a produit. Chaque section ne renseigne que ses
+    # champs (voir ITCONNECT_SECTIONS), les autres restent à None. L'ordre des champs est celui des exports.
+    category: str
+    sections: list = None
+    titre: str
+    lien: str
+    contenu: str = None
+    description: str = None
+    date: str = None
+    author: str = None
+    comments: str = None
+    chapters: str = None
+    subcategory: str = None
+    tags: list = None
+    categories: list = None
+    image_url: str = None
+    image_alt: str = None
+    # Copie locale de l'image et ses miniatures (srcset), renseignées par localize_images
+    image_local: str = None
+    image_srcset: str = None
+
+    def to_dict(self):
+        # Forme JSON (cache, base, rapport) : uniquement les champs renseignés
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+ARTICLE_FIELDS = Article.__slots__
+
+def articles_key(section):
+    # Les articles en cache ne valent que pour la description de la section (extracteur, conteneur,
+    # champs) qui les a produits : modifier sources.toml invalide ceux de la section
+    return f"{section}@{SOURCE_REGISTRY[section]['digest']}"
+
+def cached_articles(url, response, section):
+    # Page inchangée depuis la dernière exécution (304) : inutile de la réanalyser
+    if http_client.cache is None or not getattr(response, 'from_cache', False):
+        return None
+    articles = http_client.cache.load_articles(url, articles_key(section), response)
+    if articles is None:
+        return None
+    return [Article.from_dict(article) for article in articles]
+
+def remember_articles(url, response, section, articles):
+    if http_client.cache is not None:
+        http_client.cache.store_articles(url, articles_key(section), response,
+                                         [article.to_dict() for article in articles])
+    return articles
+
+# Historique local des articles (mode incrémental)
+DEFAULT_DB = 'articles.db'
+
+# Paramètres de suivi ajoutés aux liens (newsletters, réseaux sociaux), ignorés pour comparer deux articles
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'xtor')
+
+def normalize_url(url):
+    # Même article, même clé : sans fragment ni paramètres de suivi, sans /embed/ (iframes WordPress),
+    # avec un schéma et un hôte en minuscules et sans / final
+    parts = urlparse(urldefrag(url.strip())[0])
+    path = parts.path.replace('/embed/', '/')
+    if path.endswith('/embed'):
+        path = path[:-len('/embed')]
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith(TRACKING_PARAMS)
+    ])
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path.rstrip('/'), parts.params, query, ''))
+
+def dedupe_articles(results, order):
+    # Un article présent dans plusieurs sections n'est gardé qu'une fois, à sa première apparition
+    # dans l'ordre du rapport ; son champ sections liste toutes les sections où il a été trouvé
+    index = {}
+    deduped = {}
+    for section in order:
+        kept = []
+        for article in results.get(section, []):
+            key = normalize_url(article.lien)
+            record = index.get(key) if key else None
+            if record is None:
+                record = replace(article, sections=[section])
+                if key:
+                    index[key] = record
+                kept.append(record)
+            elif section not in record.sections:
+                record.sections.append(section)
+        deduped[section] = kept
+    return deduped
+
+def skip_known(articles, known):
+    if not known:
         return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping de {section_type}: {str(e)}")
-        return []
-
-def scrape_itconnect_courses(url):
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles de cours
-        course_articles = soup.find_all('article', class_='sfwd-courses')
-        
-        if course_articles:
-            for article in course_articles:
-                # Extraire le titre et le lien depuis h2.cm-entry-title > a
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
+    return [article for article in articles if not known(article.lien)]
+
+class ArticleStore:
+    # Base SQLite des articles déjà vus, indexée par lien canonique
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                lien TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                data TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )''')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS articles_category ON articles (category, first_seen)')
+        self._create_search_index()
+        self.connection.commit()
+        # Les liens connus sont gardés en mémoire : les scrapers les consultent depuis leurs threads
+        self._known = {row[0] for row in self.connection.execute('SELECT lien FROM articles')}
+
+    def known(self, lien):
+        return normalize_url(lien) in self._known
+
+    def record(self, articles):
+        # Enregistre les articles et renvoie ceux qui n'avaient encore jamais été vus
+        now = datetime.now().isoformat(timespec='seconds')
+        new_articles = []
+        with self.connection:
+            for article in articles:
+                key = normalize_url(article.lien)
+                if key in self._known:
+                    self.connection.execute('UPDATE articles SET last_seen = ? WHERE lien = ?', (now, key))
                     continue
-
-                # Extraire l'image depuis div.cm-featured-image > a > img
-                featured_image = article.find('div', class_='cm-featured-image')
-                if featured_image and featured_image.find('img'):
-                    img = featured_image.find('img')
-                    # Gérer les images avec lazy loading
-                    image_url = img.get('data-lazy-src', img.get('src', ''))
-                    image_alt = img.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire le nombre de chapitres
-                chapters_element = article.find('div', class_='course-informations__steps-count')
-                chapters = chapters_element.text.strip() if chapters_element else ""
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'chapters': chapters,
-                    'category': 'courses'
-                })
-
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des cours IT-Connect: {str(e)}")
-        return []
-
-def scrape_itconnect_sysadmin(url):
+                cursor = self.connection.execute(
+                    'INSERT INTO articles (lien, category, data, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)',
+                    (key, article.category, json.dumps(article.to_dict(), ensure_ascii=False), now, now))
+                self._index(cursor.lastrowid, article)
+                self._known.add(key)
+                new_articles.append(article)
+        return new_articles
+
+    def _create_search_index(self):
+        # Index plein texte (FTS5) sur les articles, rempli au fil des exécutions
+        exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'").fetchone()
+        if exists:
+            return
+        self.connection.execute('''
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                titre, contenu, tags, author, category,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )''')
+        # Base créée avant l'index : on indexe l'historique existant
+        for rowid, data in self.connection.execute('SELECT rowid, data FROM articles').fetchall():
+            self._index(rowid, Article.from_dict(json.loads(data)))
+
+    def _index(self, rowid, article):
+        tags = (article.tags or []) + (article.categories or [])
+        if article.subcategory:
+            tags.append(article.subcategory)
+        self.connection.execute(
+            'INSERT INTO articles_fts (rowid, titre, contenu, tags, author, category) VALUES (?, ?, ?, ?, ?, ?)',
+            (rowid, article.titre or '', article.description or article.contenu or '',
+             ' '.join(tags), article.author or '', article.category))
+
+    def search(self, query, limit=20):
+        # Résultats classés par pertinence (bm25) ; une requête qui n'est pas une syntaxe FTS5 valide
+        # (« c++ », « it-connect »...) est relancée en cherchant chaque mot tel quel.
+        # Une requête vide ou faite d'espaces ne trouve rien.
+        terms = query.split()
+        if not terms:
+            return []
+        sql = '''
+            SELECT a.lien, a.category, a.first_seen, a.data,
+                   snippet(articles_fts, -1, '[', ']', '…', 12)
+            FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+            ORDER BY bm25(articles_fts, 10.0, 1.0, 5.0, 2.0, 1.0)
+            LIMIT ?'''
+        try:
+            rows = self.connection.execute(sql, (query, limit)).fetchall()
+        except sqlite3.OperationalError:
+            quoted = ' '.join('"%s"' % term.replace('"', '""') for term in terms)
+            try:
+                rows = self.connection.execute(sql, (quoted, limit)).fetchall()
+            except sqlite3.OperationalError:
+                rows = []
+        return [
+            {'lien': lien, 'category': category, 'first_seen': first_seen,
+             'titre': json.loads(data).get('titre', ''), 'extrait': extrait}
+            for lien, category, first_seen, data, extrait in rows
+        ]
+
+    def load(self, category):
+        rows = self.connection.execute(
+            'SELECT data FROM articles WHERE category = ? ORDER BY first_seen DESC, rowid',
+            (category,))
+        return [Article.from_dict(json.loads(data)) for data, in rows]
+
+    def close(self):
+        self.connection.close()
+
+def search_articles(store, query, limit=20):
+    start = time.perf_counter()
+    results = store.search(query, limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    for result in results:
+        print(f"[{result['first_seen'][:10]}] {result['category']} - {result['titre']}")
+        print(f"    {result['lien']}")
+        if result['extrait']:
+            print(f"    {result['extrait']}")
+    print(f"{len(results)} résultat(s) pour « {query} » en {elapsed:.1f} ms")
+    return results
+
+def resolve_parser_backend(name):
+    if name == 'auto':
+        return 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Moteur d'analyse HTML inconnu : {name}")
+    if builder_registry.lookup(name) is None:
+        raise ValueError(f"Le moteur d'analyse HTML '{name}' n'est pas installé (pip install {name})")
+    return name
+
+def set_parser_backend(name):
+    global parser_backend
+    parser_backend = resolve_parser_backend(name)
+    return parser_backend
+
+def make_soup(markup, parse_only=None, backend=None):
+    # Toutes les pages passent par ici : le moteur d'analyse se choisit en un seul endroit
+    backend = backend or parser_backend
+    if backend == 'html5lib':
+        # html5lib construit toujours l'arbre complet et ignore parse_only
+        parse_only = None
+    return BeautifulSoup(markup, backend, parse_only=parse_only)
+
+def make_request(url, **kwargs):
+    # Récupération d'une page par tous les scrapers : une erreur HTTP (4xx, 5xx) lève HTTPError.
+    # Débit par site (RateLimiter) et nouvelles tentatives (RetryPolicy) sont gérés par le client HTTP.
+    response = http_client.get(url, **kwargs)
+    response.raise_for_status()
+    return response
+
+def host_semaphore(url):
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            limit = HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+            _host_semaphores[host] = threading.BoundedSemaphore(limit)
+        return _host_semaphores[host]
+
+def page_url(url, number):
+    if number == 1:
+        return url
+    # Les flux WordPress se paginent avec ?paged=N, les pages de liste avec /page/N/
+    if is_feed_url(url):
+        return f"{url}{'&' if '?' in url else '?'}paged={number}"
+    return f"{url.rstrip('/')}/page/{number}/"
+
+def is_past_last_page(error):
+    # Un 404 sur /page/N/ (ou ?paged=N pour un flux) signifie simplement que la section n'a pas autant de pages
+    response = getattr(error, 'response', None)
+    return (response is not None and response.status_code == 404
+            and ('/page/' in response.url or 'paged=' in response.url))
+
+def parse_article_date(value):
+    # Les dates IT-Connect sont au format jj/mm/aaaa ; ZATAZ n'en affiche pas
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'category': 'sysadmin'
-                })
+        return datetime.strptime(value, '%d/%m/%Y').date()
+    except (TypeError, ValueError):
+        return None
 
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des articles SysAdmin: {str(e)}")
-        return []
+def is_older_than(article, since):
+    if since is None:
+        return False
+    published = parse_article_date(article.date)
+    return published is not None and published < since
+
+def crawl_section(scrape, url, section, known=None, max_pages=1, since=None):
+    # Suit la pagination /page/N/ d'une section jusqu'à max_pages pages. Les pages sont
+    # récupérées en parallèle (PAGE_WORKERS à la fois) mais traitées dans l'ordre, et le
+    # parcours s'arrête à la première page vide, contenant un article déjà connu ou
+    # publié avant la date since. La profondeur est plafonnée par celle de la section dans le registre.
+    max_pages = min(max_pages, SECTION_MAX_PAGES.get(section) or max_pages)
+
+    def fetch_page(number):
+        reached_known = []
+
+        def page_known(lien):
+            if known(lien):
+                reached_known.append(lien)
+                return True
+            return False
+
+        with metrics.section(section):
+            articles = scrape(page_url(url, number), section, page_known if known else None)
+        return articles, bool(reached_known)
+
+    articles = []
+    seen = set()
+    # En mode incrémental, la première page suffit souvent : elle est récupérée seule, et les pages
+    # suivantes ne sont demandées en parallèle qu'une fois qu'une page ne contient aucun article connu.
+    window = 1 if known else PAGE_WORKERS
+    with ThreadPoolExecutor(max_workers=max(1, min(PAGE_WORKERS, max_pages))) as executor:
+        pending = deque()
+        next_page = 1
+        while next_page <= max_pages and len(pending) < window:
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+        while pending:
+            page_articles, reached_known = pending.popleft().result()
+            recent = [article for article in page_articles if not is_older_than(article, since)]
+            # La liste peut se décaler d'une page à l'autre si un article est publié pendant le parcours
+            articles.extend(article for article in recent if article.lien not in seen)
+            seen.update(article.lien for article in recent)
+            if not page_articles or reached_known or len(recent) < len(page_articles):
+                for future in pending:
+                    future.cancel()
+                break
+            window = PAGE_WORKERS
+            while next_page <= max_pages and len(pending) < window:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+    return articles
+
+def run_sections(tasks, max_workers=MAX_WORKERS, known=None, max_pages=1, since=None):
+    # tasks : nom de la section -> (fonction de scraping, url de la première page)
+    # Chaque section est récupérée puis analysée dans son propre thread, dès que ses pages arrivent.
+    # Les résultats sont indexés par nom pour que le rapport garde l'ordre d'une exécution séquentielle.
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(crawl_section, func, url, name, known, max_pages, since): name
+            for name, (func, url) in tasks.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                metrics.add('errors', section=name)
+                print(f"Erreur lors du scraping de la section {name}: {str(e)}")
+                results[name] = []
+            metrics.add('articles', len(results[name]), section=name)
+    return results
+
+def resolve_osint_embed(src):
+    # Une page intégrée (wp-embed) ne change plus une fois publiée : on la garde en cache par URL.
+    # Un échec (None) n'est mémorisé nulle part : ni ici, ni dans la liste d'articles de la page
+    # OSINT (scrape_zataz_section), pour être retenté à l'exécution suivante.
+    embed_url = urldefrag(src)[0]
+    cache = http_client.cache
+    if cache is not None:
+        article = cache.load_embed(embed_url)
+        if article is not None:
+            return Article.from_dict(article)
 
-def scrape_itconnect_netadmin(url):
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
+        # Récupérer le contenu de l'iframe
+        article_response = make_request(embed_url)
+        with metrics.timer('parse_seconds'):
+            article = run_parse(parse_osint_embed, article_response.text, parser_backend)
+    except Exception as e:
+        metrics.add('errors')
+        print(f"Erreur lors de la récupération de l'article {src}: {str(e)}")
+        return None
 
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
+    if article is not None and cache is not None:
+        cache.store_embed(embed_url, article.to_dict())
+    return article
 
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la catégorie
-                category_element = article.find('div', class_='cm-post-categories')
-                if category_element and category_element.find('a'):
-                    category = category_element.find('a').text.strip()
-                else:
-                    category = "Non catégorisé"
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'subcategory': category,
-                    'category': 'netadmin'
-                })
+def parse_osint_embed(markup, backend=None):
+    article_soup = make_soup(markup, EMBED_STRAINER, backend)
 
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des articles NetAdmin: {str(e)}")
-        return []
+    # Trouver le div principal de l'article dans l'iframe
+    article_div = article_soup.find('div', class_=lambda x: x and 'wp-embed post-' in x)
+    if not article_div:
+        return None
 
-def scrape_itconnect_cybersec(url):
+    # Récupérer le titre et le lien depuis wp-embed-heading
+    heading = article_div.find('p', class_='wp-embed-heading')
+    if heading and heading.find('a'):
+        lien_element = heading.find('a')
+        titre = lien_element.text.strip()
+        # Enlever '/embed/' de l'URL
+        lien = lien_element['href'].replace('/embed/', '/')
+    else:
+        titre = "Titre non disponible"
+        lien = "#"
+
+    # Récupérer le contenu depuis wp-embed-excerpt
+    excerpt = article_div.find('div', class_='wp-embed-excerpt')
+    if excerpt and excerpt.find('p'):
+        contenu = excerpt.find('p').text.strip()
+    else:
+        contenu = "Contenu non disponible"
+
+    return Article(titre=titre, lien=lien, contenu=contenu, category='osint')
+
+def scrape_zataz_section(url, section_type, known=None):
+    # known : fonction indiquant si un lien est déjà connu (mode incrémental), ces cartes sont ignorées
     try:
         response = make_request(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire les tags
-                tags = []
-                tags_element = article.find('span', class_='cm-tag-links')
-                if tags_element and tags_element.find_all('a'):
-                    tags = [tag.text.strip() for tag in tags_element.find_all('a')]
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'tags': tags,
-                    'category': 'cybersec'
-                })
-
-        return articles
+        cached = cached_articles(url, response, section_type)
+        if cached is not None:
+            return skip_known(cached, known)
+        embedded = SOURCE_REGISTRY[section_type]['scraper'] == 'zataz-osint'
+        with metrics.timer('parse_seconds'):
+            if embedded:
+                sources = run_parse(parse_listing, section_type, response.text, parser_backend)
+            else:
+                articles = run_parse(parse_listing, section_type, response.text, parser_backend, known=known)
+
+        if embedded:
+            # Pour la section OSINT avec gestion des iframes : les pages intégrées
+            # sont récupérées en parallèle, l'ordre d'affichage reste celui de la page
+            articles = []
+            with ThreadPoolExecutor(max_workers=EMBED_WORKERS) as executor:
+                for article in executor.map(metrics.bind(resolve_osint_embed), sources):
+                    if article:
+                        # Une page intégrée peut servir à plusieurs sections du registre
+                        articles.append(replace(article, category=section_type))
+            complete = len(articles) == len(sources)
+            articles = skip_known(articles, known)
+            # Une page intégrée en échec n'est pas mise en cache : sans cette liste, la prochaine
+            # exécution réanalyse la page (même sur un 304) et retente uniquement les pages manquantes
+            if not complete:
+                return articles
+
+        # Une liste filtrée par le mode incrémental ne doit pas remplacer la page complète en cache
+        if known:
+            return articles
+        return remember_articles(url, response, section_type, articles)
     except Exception as e:
-        print(f"Erreur lors du scraping des articles Cybersécurité: {str(e)}")
+        if not is_past_last_page(e):
+            metrics.add('errors')
+            print(f"Erreur lors du scraping de {section_type}: {str(e)}")
         return []
 
-def scrape_itconnect_cybernews(url):
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
+def osint_sources(soup):
+    # Adresses des pages intégrées (iframes wp-embed) de la page OSINT
+    iframes = soup.find_all('iframe', class_='wp-embedded-content')
+    return [iframe.get('src', '') for iframe in iframes if iframe.get('src', '')]
+
+def parse_zataz_cards(soup, section_type, known=None):
+    # Pour les sections ZATAZ qui listent des articles (cybersécurité, darknet...)
+    articles = []
+    items = soup.find_all('div', class_='blog-context-wrapper')
+    for item in items:
+        titre_element = item.find('h2', class_='blog-title')
+        if titre_element and titre_element.find('a'):
+            lien_element = titre_element.find('a')
+            titre = lien_element.text.strip()
+            lien = lien_element['href']
+        else:
+            titre = "Titre non disponible"
+            lien = "#"
+        if known and known(lien):
+            continue
 
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
+        contenu_element = item.find('div', class_='blog-content')
+        contenu = contenu_element.text.strip() if contenu_element else "Contenu non disponible"
+        articles.append(Article(titre=titre, lien=lien, contenu=contenu, category=section_type))
+    return articles
+
+class Field:
+    # Un champ d'une carte d'article : sélecteur CSS, manière d'en lire la valeur et valeur par défaut.
+    # kind vaut 'text' (texte du premier élément), 'attr' (premier attribut présent parmi attrs)
+    # ou 'list' (texte de tous les éléments trouvés).
+    def __init__(self, selector, kind='text', default='', attrs=()):
+        self.selector = selector
+        self.kind = kind
+        self.default = default
+        self.attrs = attrs
+
+    def value(self, elements):
+        if self.kind == 'list':
+            return [element.text.strip() for element in elements]
+        if not elements:
+            return self.default
+        element = elements[0]
+        if self.kind == 'attr':
+            for attr in self.attrs:
+                if element.has_attr(attr):
+                    return element[attr]
+            return self.default
+        return element.text.strip()
+
+# Champs communs aux cartes IT-Connect (thème ColorMag)
+ITCONNECT_FIELDS = {
+    'titre': Field('h2.cm-entry-title a', default=None),
+    'lien': Field('h2.cm-entry-title a', 'attr', None, ('href',)),
+    'image_url': Field('div.cm-featured-image img', 'attr', '', ('data-lazy-src', 'src')),
+    'image_alt': Field('div.cm-featured-image img', 'attr', '', ('alt',)),
+    'description': Field('div.cm-entry-summary p'),
+    'date': Field('span.cm-post-date time'),
+    'author': Field('span.cm-author a'),
+    'comments': Field('span.cm-comments-link a', default='0 commentaire'),
+    'tags': Field('span.cm-tag-links a', 'list'),
+    'categories': Field('div.cm-post-categories a', 'list'),
+    'subcategory': Field('div.cm-post-categories a', default='Non catégorisé'),
+    'chapters': Field('div.course-informations__steps-count'),
+}
+
+def compile_selector(selector):
+    # Sélecteurs simples uniquement : "balise.classe" ou "balise.classe balise" (descendant)
+    def simple(part):
+        name, _, class_name = part.partition('.')
+        return name, class_name or None
+    parts = selector.split()
+    if len(parts) == 1:
+        return None, simple(parts[0])
+    if len(parts) == 2:
+        return simple(parts[0]), simple(parts[1])
+    raise ValueError(f"Sélecteur non pris en charge : {selector}")
+
+def matches(element, name, class_name):
+    return element.name == name and (class_name is None or class_name in element.get('class', ()))
+
+class CardExtractor:
+    # Compile une fois les sélecteurs d'une section, puis lit tous les champs d'une carte
+    # en un seul parcours de ses descendants : chaque élément n'est comparé qu'aux
+    # sélecteurs qui visent sa balise, au lieu d'une chaîne de find() par champ.
+    def __init__(self, field_names, fields=ITCONNECT_FIELDS):
+        self.fields = [(name, fields[name]) for name in field_names]
+        self.rules = {}
+        for selector in dict.fromkeys(field.selector for _, field in self.fields):
+            scope, (name, class_name) = compile_selector(selector)
+            self.rules.setdefault(name, []).append((selector, class_name, scope))
+
+    def extract(self, card):
+        found = {selector: [] for rules in self.rules.values() for selector, _, _ in rules}
+        for element in card.descendants:
+            rules = self.rules.get(element.name)
+            if not rules:
+                continue
+            for selector, class_name, scope in rules:
+                if class_name is not None and class_name not in element.get('class', ()):
                     continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'category': 'cybernews'
-                })
-
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des actualités Cybersécurité: {str(e)}")
-        return []
-
-def scrape_itconnect_webnews(url):
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
+                if scope is not None and not self._inside(element, card, scope):
                     continue
+                found[selector].append(element)
+        return {name: field.value(found[field.selector]) for name, field in self.fields}
+
+    def _inside(self, element, card, scope):
+        for parent in element.parents:
+            if parent is card:
+                return False
+            if matches(parent, *scope):
+                return True
+        return False
+
+def itconnect_section(container, fields, label, link_label="Lire l'actualité", tag_class='tag'):
+    name, class_name = container
+    return {
+        'container': container,
+        'strainer': SoupStrainer(name, class_=has_class(class_name)),
+        'extractor': CardExtractor(fields),
+        'link_extractor': CardExtractor(('lien',)),
+        'label': label,
+        'link_label': link_label,
+        'tag_class': tag_class,
+    }
 
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                # Extraire les commentaires
-                comments_element = article.find('span', class_='cm-comments-link').find('a')
-                comments = comments_element.text.strip() if comments_element else "0 commentaire"
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'comments': comments,
-                    'category': 'webnews'
-                })
-
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des actualités Web: {str(e)}")
-        return []
-
-def scrape_itconnect_osnews(url):
+def parse_itconnect_cards(soup, section, known=None):
+    spec = ITCONNECT_SECTIONS[section]
+    name, class_name = spec['container']
+    articles = []
+    for card in soup.find_all(name, class_=class_name):
+        # En mode incrémental, seul le lien d'une carte déjà vue est lu
+        if known and known(spec['link_extractor'].extract(card)['lien']):
+            continue
+        fields = spec['extractor'].extract(card)
+        # Une carte sans lien vers l'article n'est pas exploitable
+        if fields['lien'] is None:
+            continue
+        articles.append(Article(category=section, **fields))
+    return articles
+
+def parse_listing(section, markup, backend=None, known=None):
+    # Analyse d'une page de liste déjà téléchargée : ses articles, ou pour OSINT les adresses des
+    # pages intégrées. Fonction de module sans état global (moteur passé explicitement) : elle peut
+    # s'exécuter dans un autre processus (voir run_parse).
+    if SOURCE_REGISTRY[section]['scraper'] == 'zataz-osint':
+        return osint_sources(make_soup(markup, OSINT_STRAINER, backend))
+    if section in ITCONNECT_SECTIONS:
+        return parse_itconnect_cards(make_soup(markup, ITCONNECT_SECTIONS[section]['strainer'], backend),
+                                     section, known)
+    return parse_zataz_cards(make_soup(markup, ZATAZ_STRAINER, backend), section, known)
+
+# Pool de processus pour l'analyse HTML (--parse-workers) : les threads de téléchargement lui
+# confient le texte des pages et attendent les articles, l'analyse utilise alors plusieurs cœurs
+parse_pool = None
+
+def configure_parse_pool(workers=0, sources_file=None):
+    # sources_file : registre des sources à charger dans chaque processus (par défaut celui de l'import)
+    global parse_pool
+    if parse_pool is not None:
+        parse_pool.shutdown()
+    parse_pool = None
+    if workers > 0:
+        # spawn : des processus neufs plutôt qu'une copie (fork) d'un programme qui a déjà des threads
+        parse_pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=configure_sources if sources_file else None,
+                                         initargs=(sources_file,) if sources_file else ())
+    return parse_pool
+
+def run_parse(func, *args, known=None):
+    # func(*args) dans le pool s'il est configuré, sinon dans le thread courant. Une fonction ne se
+    # transmet pas à un autre processus : avec le pool, les liens connus sont écartés au retour.
+    if parse_pool is None:
+        return func(*args, known=known) if known else func(*args)
+    return skip_known(parse_pool.submit(func, *args).result(), known)
+
+def scrape_itconnect_section(url, section, known=None):
+    spec = ITCONNECT_SECTIONS[section]
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                # Extraire les tags
-                tags = []
-                tags_element = article.find('span', class_='cm-tag-links')
-                if tags_element and tags_element.find_all('a'):
-                    tags = [tag.text.strip() for tag in tags_element.find_all('a')]
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'tags': tags,
-                    'category': 'osnews'
-                })
-
-        return articles
+        response = make_request(url)
+        cached = cached_articles(url, response, section)
+        if cached is not None:
+            return skip_known(cached, known)
+        with metrics.timer('parse_seconds'):
+            articles = run_parse(parse_listing, section, response.text, parser_backend, known=known)
+        if known:
+            return articles
+        return remember_articles(url, response, section, articles)
     except Exception as e:
-        print(f"Erreur lors du scraping des actualités OS: {str(e)}")
+        if not is_past_last_page(e):
+            metrics.add('errors')
+            print(f"Erreur lors du scraping {spec['label']}: {str(e)}")
         return []
 
-def scrape_itconnect_hardnews(url):
-    try:
-        # Ajout des headers pour simuler un navigateur
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Connection': 'keep-alive',
-        }
-        
-        # Ajout des headers à la requête
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                # Extraire les commentaires
-                comments_element = article.find('span', class_='cm-comments-link').find('a')
-                comments = comments_element.text.strip() if comments_element else "0 commentaire"
-
-                # Extraire les tags
-                tags = []
-                tags_element = article.find('span', class_='cm-tag-links')
-                if tags_element and tags_element.find_all('a'):
-                    tags = [tag.text.strip() for tag in tags_element.find_all('a')]
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'comments': comments,
-                    'tags': tags,
-                    'category': 'hardnews'
-                })
-
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des actualités Hardware: {str(e)}")
-        return []
+# Lecture des flux RSS / Atom WordPress (/feed/ de chaque catégorie) : quelques Ko de données
+# structurées par page au lieu de la page HTML complète du thème
+SOURCES = ('html', 'feed')
+FEED_HEADERS = {'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'}
+FEED_NAMESPACES = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'content': 'http://purl.org/rss/1.0/modules/content/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'media': 'http://search.yahoo.com/mrss/',
+    'slash': 'http://purl.org/rss/1.0/modules/slash/',
+}
+
+def feed_url(url):
+    return f"{url.rstrip('/')}/feed/"
+
+def is_feed_url(url):
+    return urlparse(url).path.rstrip('/').endswith('/feed')
+
+def feed_tasks(tasks):
+    # Même découpage que les pages HTML, en lisant le flux de chaque section qui en a un
+    return {
+        name: (func, url) if name in FEEDLESS_SECTIONS else (scrape_feed_section, feed_url(url))
+        for name, (func, url) in tasks.items()
+    }
 
-def scrape_itconnect_mobilenews(url):
+def feed_text(element, path):
+    found = element.find(path, FEED_NAMESPACES)
+    return (found.text or '').strip() if found is not None else ''
+
+def html_summary(markup):
+    # Extrait du flux : le premier paragraphe, sans le « L'article ... est apparu en premier sur ... »
+    if not markup:
+        return '', None
+    soup = make_soup(markup, backend='html.parser')
+    paragraph = soup.find('p')
+    text = (paragraph or soup).get_text(' ', strip=True)
+    return text, soup.find('img')
+
+def feed_date(value):
+    # RSS : date RFC 822 ; Atom : date ISO 8601. Même format jj/mm/aaaa que les pages HTML
+    if not value:
+        return ''
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                # Extraire les commentaires
-                comments_element = article.find('span', class_='cm-comments-link').find('a')
-                comments = comments_element.text.strip() if comments_element else "0 commentaire"
-
-                # Extraire les catégories
-                categories = []
-                categories_element = article.find('div', class_='cm-post-categories')
-                if categories_element and categories_element.find_all('a'):
-                    categories = [cat.text.strip() for cat in categories_element.find_all('a')]
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'comments': comments,
-                    'categories': categories,
-                    'category': 'mobilenews'
-                })
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return ''
+    return published.strftime('%d/%m/%Y')
+
+def feed_entry_values(entry):
+    # Valeurs communes d'un <item> RSS ou d'une <entry> Atom
+    if entry.tag == f"{{{FEED_NAMESPACES['atom']}}}entry":
+        link = entry.find("atom:link[@rel='alternate']", FEED_NAMESPACES)
+        if link is None:
+            link = entry.find('atom:link', FEED_NAMESPACES)
+        summary, image = html_summary(feed_text(entry, 'atom:summary') or feed_text(entry, 'atom:content'))
+        return {
+            'titre': feed_text(entry, 'atom:title'),
+            'lien': link.get('href') if link is not None else None,
+            'summary': summary,
+            'image': image,
+            'date': feed_date(feed_text(entry, 'atom:published') or feed_text(entry, 'atom:updated')),
+            'author': feed_text(entry, 'atom:author/atom:name'),
+            'comments': None,
+            'terms': [category.get('term', '') for category in entry.findall('atom:category', FEED_NAMESPACES)],
+            'media': None,
+        }
+    summary, image = html_summary(feed_text(entry, 'description'))
+    if image is None:
+        image = html_summary(feed_text(entry, 'content:encoded'))[1]
+    media = entry.find('media:content', FEED_NAMESPACES)
+    if media is None:
+        media = entry.find('media:thumbnail', FEED_NAMESPACES)
+    if media is None:
+        media = entry.find("enclosure[@type]", FEED_NAMESPACES)
+        if media is not None and not media.get('type', '').startswith('image/'):
+            media = None
+    comments = feed_text(entry, 'slash:comments')
+    return {
+        'titre': feed_text(entry, 'title'),
+        'lien': feed_text(entry, 'link') or None,
+        'summary': summary,
+        'image': image,
+        'date': feed_date(feed_text(entry, 'pubDate')),
+        'author': feed_text(entry, 'dc:creator'),
+        'comments': int(comments) if comments.isdigit() else None,
+        'terms': [category.text.strip() for category in entry.findall('category') if category.text],
+        'media': media,
+    }
 
-        return articles
-    except Exception as e:
-        print(f"Erreur lors du scraping des actualités Mobile: {str(e)}")
-        return []
+def feed_article(values, section):
+    # Un article du flux avec exactement les champs que la page HTML de la section aurait donnés
+    if section not in ITCONNECT_SECTIONS:
+        return Article(titre=values['titre'], lien=values['lien'], category=section,
+                       contenu=values['summary'] or "Contenu non disponible")
+    image = values['image']
+    image_url = values['media'].get('url', '') if values['media'] is not None else ''
+    if not image_url and image is not None:
+        image_url = image.get('data-lazy-src') or image.get('src', '')
+    comments = values['comments']
+    available = {
+        'titre': values['titre'],
+        'lien': values['lien'],
+        'image_url': image_url,
+        'image_alt': image.get('alt', '') if image is not None else '',
+        'description': values['summary'],
+        'date': values['date'],
+        'author': values['author'],
+        'comments': f"{comments} commentaire{'s' if comments > 1 else ''}" if comments is not None else None,
+        'tags': values['terms'],
+        'categories': values['terms'],
+        'subcategory': values['terms'][0] if values['terms'] else None,
+        'chapters': None,
+    }
+    fields = {}
+    for name, field in ITCONNECT_SECTIONS[section]['extractor'].fields:
+        value = available.get(name)
+        fields[name] = field.value([]) if value in (None, '') else value
+    return Article(category=section, **fields)
+
+def parse_feed(content, section, known=None):
+    root = ET.fromstring(content)
+    entries = root.findall('channel/item') or root.findall('atom:entry', FEED_NAMESPACES)
+    articles = []
+    for entry in entries:
+        values = feed_entry_values(entry)
+        if not values['lien']:
+            continue
+        if known and known(values['lien']):
+            continue
+        articles.append(feed_article(values, section))
+    return articles
 
-def scrape_itconnect_deals(url):
+def scrape_feed_section(url, section, known=None):
+    # url : flux de la section (feed_url), éventuellement paginé (?paged=N)
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = []
-
-        # Trouver tous les articles
-        article_elements = soup.find_all('article', class_='post')
-        
-        if article_elements:
-            for article in article_elements:
-                # Extraire le titre et le lien
-                titre_element = article.find('h2', class_='cm-entry-title').find('a')
-                if titre_element:
-                    titre = titre_element.text.strip()
-                    lien = titre_element['href']
-                else:
-                    continue
-
-                # Extraire l'image
-                image_element = article.find('div', class_='cm-featured-image').find('img')
-                if image_element:
-                    image_url = image_element.get('data-lazy-src', image_element.get('src', ''))
-                    image_alt = image_element.get('alt', '')
-                else:
-                    image_url = ""
-                    image_alt = ""
-
-                # Extraire la description
-                description_element = article.find('div', class_='cm-entry-summary').find('p')
-                description = description_element.text.strip() if description_element else ""
-
-                # Extraire la date
-                date_element = article.find('span', class_='cm-post-date').find('time')
-                date = date_element.text.strip() if date_element else ""
-
-                # Extraire l'auteur
-                author_element = article.find('span', class_='cm-author').find('a')
-                author = author_element.text.strip() if author_element else ""
-
-                # Extraire les commentaires
-                comments_element = article.find('span', class_='cm-comments-link').find('a')
-                comments = comments_element.text.strip() if comments_element else "0 commentaire"
-
-                # Extraire les tags
-                tags = []
-                tags_element = article.find('span', class_='cm-tag-links')
-                if tags_element and tags_element.find_all('a'):
-                    tags = [tag.text.strip() for tag in tags_element.find_all('a')]
-
-                articles.append({
-                    'titre': titre,
-                    'lien': lien,
-                    'image_url': image_url,
-                    'image_alt': image_alt,
-                    'description': description,
-                    'date': date,
-                    'author': author,
-                    'comments': comments,
-                    'tags': tags,
-                    'category': 'deals'
-                })
-
-        return articles
+        response = make_request(url, headers=FEED_HEADERS)
+        cached = cached_articles(url, response, section)
+        if cached is not None:
+            return skip_known(cached, known)
+        with metrics.timer('parse_seconds'):
+            articles = run_parse(parse_feed, response.content, section, known=known)
+        if known:
+            return articles
+        return remember_articles(url, response, section, articles)
     except Exception as e:
-        print(f"Erreur lors du scraping des bons plans: {str(e)}")
+        if not is_past_last_page(e):
+            metrics.add('errors')
+            print(f"Erreur lors de la lecture du flux {section}: {str(e)}")
         return []
 
 def scrape_youtube_channel_simple(url):
     try:
         response = make_request(url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = make_soup(response.text)
         
         # Récupérer les informations de base de la chaîne
         channel_info = {
@@ -730,20 +1402,8 @@ def scrape_youtube_channel_simple(url):
         print(f"Erreur lors du scraping de la chaîne YouTube: {str(e)}")
         return None
 
-def scrape_zataz(output_title=None):
-    try:
-        # Gestion du nom du fichier de sortie
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if output_title:
-            output_file = f'{output_title}.html'
-        else:
-            output_file = f'articles_{timestamp}.html'
-
-        # Obtenir la date actuelle au format français
-        current_time = datetime.now().strftime("%d/%m/%Y")
-
-        # Template HTML avec le nouveau design
-        html_content = """
+# Début du rapport : styles, scripts et ouverture de la barre d'onglets
+REPORT_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -975,8 +1635,129 @@ def scrape_zataz(output_title=None):
                     margin: 0 1rem 1rem;
                     border-radius: 4px;
                 }
-            </style>
+            
+        /* Styles pour les articles ZATAZ */
+        .article-content {
+            padding: 1.5rem;
+            display: flex;
+            flex-direction: column;
+            height: 100%;
+            position: relative;
+            background: linear-gradient(145deg, #ffffff 0%, #f8f9fa 100%);
+        }
+
+        .article-category {
+            display: inline-block;
+            padding: 0.4rem 0.8rem;
+            background: #00b894;
+            color: white;
+            border-radius: 4px;
+            font-size: 0.8rem;
+            font-weight: 500;
+            margin-bottom: 1rem;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+
+        .article .description {
+            color: #636e72;
+            line-height: 1.6;
+            margin: 1rem 0;
+            flex-grow: 1;
+        }
+
+        /* Styles pour la section YouTube */
+        .youtube-channels {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 2rem;
+            padding: 2rem;
+            max-width: 1400px;
+            margin: 0 auto;
+        }
+
+        .section-title {
+            text-align: center;
+            color: #2d3436;
+            margin: 2rem 0;
+            font-size: 2.5rem;
+            font-weight: 600;
+        }
+
+        .channel-card {
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+        }
+
+        .channel-content {
+            display: flex;
+            flex-direction: column;
+            height: 100%;
+            justify-content: space-between;
+        }
+
+        .channel-description {
+            flex-grow: 1;
+        }
+
+        .channel-link {
+            display: inline-flex;
+            align-items: center;
+            gap: 0.5rem;
+            color: #00b894;
+            text-decoration: none;
+            font-weight: 500;
+            font-size: 1.1rem;
+            transition: all 0.3s ease;
+        }
+
+        .channel-link:hover {
+            color: #00a884;
+        }
+
+        .channel-link .arrow {
+            transition: transform 0.3s ease;
+        }
+
+        .channel-link:hover .arrow {
+            transform: translateX(5px);
+        }
+
+        /* Recherche et affichage progressif des cartes */
+        .search {
+            width: 100%;
+            padding: 0.8rem 1rem;
+            margin-bottom: 1rem;
+            border: 1px solid #dfe6e9;
+            border-radius: 8px;
+            font-size: 1rem;
+        }
+
+        .results-count {
+            color: #636e72;
+            font-size: 0.9rem;
+            padding: 0 1rem;
+        }
+
+        .articles-grid {
+            /* Les marges haute et basse tiennent la place des cartes hors fenêtre (voir update) */
+            overflow-anchor: none;
+        }
+        </style>
             <script>
+            // Les articles sont embarqués en JSON à la fin du document. Seules les rangées de cartes
+            // proches de l'écran existent dans le DOM (défilement virtuel) : les autres sont remplacées
+            // par les marges de la grille, d'une hauteur estimée d'après les rangées affichées.
+            // Les filtres (catégorie, recherche) s'appuient sur des index construits une seule fois
+            // au chargement au lieu de parcourir toutes les cartes à chaque clic.
+            var BUFFER_ROWS = 3;
+            var ROW_HEIGHT = 460;
+            var report = null;
+            var views = {};
+            var searchTimer = null;
+            var updateQueued = false;
+
             function openTab(evt, tabName) {
                 var i, content, tablinks;
                 content = document.getElementsByClassName("content");
@@ -989,28 +1770,292 @@ def scrape_zataz(output_title=None):
                 }
                 document.getElementById(tabName).style.display = "block";
                 evt.currentTarget.className += " active";
+                if (views[tabName]) {
+                    update(tabName);
+                }
+            }
+
+            function normalizeText(text) {
+                return String(text || "").toLowerCase().normalize("NFD").replace(/[\\u0300-\\u036f]/g, "");
+            }
+
+            function tokenize(text) {
+                return normalizeText(text).split(/[^a-z0-9]+/).filter(function (term) {
+                    return term.length > 1;
+                });
+            }
+
+            function escapeHtml(value) {
+                return String(value == null ? "" : value).replace(/[&<>"']/g, function (c) {
+                    return {"&": "&amp;", "<": "&lt;", ">": "&gt;", "\\"": "&quot;", "'": "&#39;"}[c];
+                });
+            }
+
+            function safeUrl(url) {
+                return /^\\s*(javascript|vbscript|data):/i.test(url || "") ? "#" : escapeHtml(url);
+            }
+
+            function articleSections(article) {
+                return article.sections || [article.category];
+            }
+
+            function buildIndex(data) {
+                // onglet -> catégorie -> indices des articles ; terme -> indices des articles
+                var index = {tabs: Object.create(null), terms: Object.create(null)};
+                data.articles.forEach(function (article, i) {
+                    var sections = articleSections(article);
+                    var tab = data.sections[sections[0]].tab;
+                    var byCategory = index.tabs[tab] || (index.tabs[tab] = {all: []});
+                    byCategory.all.push(i);
+                    sections.forEach(function (section) {
+                        (byCategory[section] || (byCategory[section] = [])).push(i);
+                    });
+                    var text = [article.titre, article.description || article.contenu, article.author,
+                                article.subcategory, (article.tags || []).join(" "),
+                                (article.categories || []).join(" ")].join(" ");
+                    var seen = Object.create(null);
+                    tokenize(text).forEach(function (term) {
+                        if (!seen[term]) {
+                            seen[term] = true;
+                            (index.terms[term] || (index.terms[term] = [])).push(i);
+                        }
+                    });
+                });
+                // Liste triée : les termes commençant par un préfixe y sont contigus (recherche dichotomique)
+                index.termList = Object.keys(index.terms).sort();
+                return index;
+            }
+
+            function searchIndex(query) {
+                // Chaque mot de la requête doit préfixer un terme de l'article
+                var terms = tokenize(query);
+                if (!terms.length) {
+                    return null;
+                }
+                var result = null;
+                var termList = report.index.termList;
+                terms.forEach(function (term) {
+                    var found = Object.create(null);
+                    var low = 0, high = termList.length;
+                    while (low < high) {
+                        var middle = (low + high) >> 1;
+                        if (termList[middle] < term) {
+                            low = middle + 1;
+                        } else {
+                            high = middle;
+                        }
+                    }
+                    for (var k = low; k < termList.length && termList[k].lastIndexOf(term, 0) === 0; k++) {
+                        report.index.terms[termList[k]].forEach(function (i) {
+                            found[i] = true;
+                        });
+                    }
+                    if (result === null) {
+                        result = found;
+                    } else {
+                        Object.keys(result).forEach(function (i) {
+                            if (!found[i]) {
+                                delete result[i];
+                            }
+                        });
+                    }
+                });
+                return result;
+            }
+
+            function renderTags(containerClass, tagClass, values) {
+                return '<div class="' + containerClass + '">' + values.map(function (value) {
+                    return '<span class="' + tagClass + '">' + escapeHtml(value) + '</span>';
+                }).join(" ") + '</div>';
+            }
+
+            function renderCard(article) {
+                var sections = articleSections(article);
+                var spec = report.data.sections[sections[0]];
+                var link = safeUrl(article.lien);
+                var parts = ['<div class="article" data-category="' + escapeHtml(sections.join(" ")) + '">'];
+                if (spec.card === "zataz") {
+                    parts.push('<div class="article-content">',
+                               '<div class="article-category">' + escapeHtml(sections.join(" / ").toUpperCase()) + '</div>',
+                               '<h2 class="titre">' + escapeHtml(article.titre) + '</h2>',
+                               '<p class="description">' + escapeHtml((article.contenu || "").slice(0, 200)) + '...</p>',
+                               '<a href="' + link + '" class="lien" target="_blank">' + escapeHtml(spec.link_label) + '</a>',
+                               '</div></div>');
+                    return parts.join("");
+                }
+                parts.push('<div class="article-image"><a href="' + link + '" target="_blank">' +
+                           '<img src="' + safeUrl(article.image_local || article.image_url) + '"' +
+                           (article.image_srcset ? ' srcset="' + escapeHtml(article.image_srcset) + '" sizes="(max-width: 800px) 100vw, 450px"' : '') +
+                           ' alt="' + escapeHtml(article.image_alt) + '" loading="lazy">' +
+                           '</a></div>');
+                if ("date" in article) {
+                    parts.push('<div class="article-meta">' +
+                               '<span class="date">' + escapeHtml(article.date) + '</span>' +
+                               '<span class="author">Par ' + escapeHtml(article.author) + '</span>' +
+                               ("comments" in article ? '<span class="comments">' + escapeHtml(article.comments) + '</span>' : "") +
+                               '</div>');
+                }
+                parts.push('<h2 class="titre">' + escapeHtml(article.titre) + '</h2>');
+                if ("chapters" in article) {
+                    parts.push('<div class="chapters">' + escapeHtml(article.chapters) + '</div>');
+                }
+                if ("subcategory" in article) {
+                    parts.push('<div class="subcategory-tag">' + escapeHtml(article.subcategory) + '</div>');
+                }
+                if (article.tags) {
+                    parts.push(renderTags("tags", spec.tag_class, article.tags));
+                }
+                if (article.categories) {
+                    parts.push(renderTags("categories", "category-tag", article.categories));
+                }
+                if ("description" in article) {
+                    parts.push('<p class="description">' + escapeHtml(article.description) + '</p>');
+                }
+                parts.push('<a href="' + link + '" class="lien" target="_blank">' + escapeHtml(spec.link_label) + '</a></div>');
+                return parts.join("");
+            }
+
+            function gridColumns(grid) {
+                // Nombre de colonnes calculé par le navigateur (repeat(auto-fill, ...))
+                return Math.max(1, getComputedStyle(grid).gridTemplateColumns.split(" ").length);
+            }
+
+            function update(tab) {
+                // Affiche les rangées visibles (plus BUFFER_ROWS au-dessus et au-dessous) et retire les
+                // autres. Les cartes déjà présentes sont conservées, seules les nouvelles sont construites.
+                var view = views[tab];
+                if (view.grid.offsetParent === null) {
+                    return;
+                }
+                var columns = gridColumns(view.grid);
+                var rows = Math.ceil(view.items.length / columns);
+                // Distance entre le haut de l'écran et la première rangée de la liste complète
+                var offset = -view.grid.getBoundingClientRect().top - view.padTop;
+                var first = Math.min(rows, Math.max(0, Math.floor(offset / view.rowHeight) - BUFFER_ROWS));
+                var last = Math.min(rows, Math.max(first, Math.ceil((offset + window.innerHeight) / view.rowHeight) + BUFFER_ROWS));
+                if (first === view.first && last === view.last && columns === view.columns) {
+                    return;
+                }
+                view.first = first;
+                view.last = last;
+                view.columns = columns;
+
+                var start = first * columns, end = Math.min(view.items.length, last * columns);
+                var nodes = Object.create(null), missing = [], k;
+                for (k = start; k < end; k++) {
+                    var node = view.nodes[view.items[k]];
+                    if (node) {
+                        nodes[view.items[k]] = node;
+                    } else {
+                        missing.push(view.items[k]);
+                    }
+                }
+                if (missing.length) {
+                    var holder = document.createElement("div");
+                    holder.innerHTML = missing.map(function (i) { return renderCard(report.data.articles[i]); }).join("");
+                    var created = Array.prototype.slice.call(holder.children);
+                    missing.forEach(function (i, n) {
+                        nodes[i] = created[n];
+                    });
+                }
+                var ordered = [];
+                for (k = start; k < end; k++) {
+                    ordered.push(nodes[view.items[k]]);
+                }
+                view.nodes = nodes;
+                view.grid.replaceChildren.apply(view.grid, ordered);
+                setPadding(view, rows);
+
+                // Hauteur réelle des rangées affichées : corrige l'estimation sans déplacer ce qui est à l'écran
+                if (last > first) {
+                    var content = view.grid.getBoundingClientRect().height - parseFloat(view.grid.style.paddingTop) -
+                                  parseFloat(view.grid.style.paddingBottom);
+                    var measured = (content + view.gap) / (last - first);
+                    if (Math.abs(measured - view.rowHeight) > 1) {
+                        var shift = first * (measured - view.rowHeight);
+                        view.rowHeight = measured;
+                        setPadding(view, rows);
+                        if (shift) {
+                            window.scrollBy(0, shift);
+                        }
+                    }
+                }
+            }
+
+            function setPadding(view, rows) {
+                view.grid.style.paddingTop = (view.padTop + view.first * view.rowHeight) + "px";
+                view.grid.style.paddingBottom = (view.padBottom + (rows - view.last) * view.rowHeight) + "px";
+            }
+
+            function scheduleUpdate() {
+                // Au plus une mise à jour par image, pour l'onglet affiché
+                if (updateQueued) {
+                    return;
+                }
+                updateQueued = true;
+                window.requestAnimationFrame(function () {
+                    updateQueued = false;
+                    Object.keys(views).forEach(update);
+                });
+            }
+
+            function refresh(tab) {
+                var view = views[tab];
+                var byCategory = report.index.tabs[tab] || {};
+                var items = byCategory[view.category] || [];
+                var matches = searchIndex(view.query);
+                view.items = matches ? items.filter(function (i) { return matches[i]; }) : items;
+                view.first = view.last = -1;
+                view.nodes = Object.create(null);
+                view.grid.replaceChildren();
+                view.count.textContent = view.items.length + " article(s)";
+                update(tab);
             }
 
             function filterCategory(category, button) {
-                var articles = document.getElementsByClassName("article");
                 var buttons = button.parentElement.getElementsByClassName("subcategory");
                 
                 for (var i = 0; i < buttons.length; i++) {
                     buttons[i].classList.remove("active");
                 }
                 button.classList.add("active");
-                
-                for (var i = 0; i < articles.length; i++) {
-                    if (category === "all" || articles[i].getAttribute("data-category") === category) {
-                        articles[i].style.display = "block";
-                    } else {
-                        articles[i].style.display = "none";
-                    }
-                }
+
+                var tab = button.closest(".content").id;
+                views[tab].category = category;
+                refresh(tab);
             }
 
-            // Activer le premier onglet par défaut
+            function searchArticles(tab, query) {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(function () {
+                    views[tab].query = query;
+                    refresh(tab);
+                }, 150);
+            }
+
+            // Charger les articles puis activer le premier onglet par défaut
             document.addEventListener("DOMContentLoaded", function() {
+                var data = JSON.parse(document.getElementById("articles-data").textContent);
+                report = {data: data, index: buildIndex(data)};
+                var grids = document.querySelectorAll(".articles-grid[data-tab]");
+                for (var i = 0; i < grids.length; i++) {
+                    (function (grid) {
+                        var tab = grid.getAttribute("data-tab");
+                        var content = document.getElementById(tab);
+                        var style = getComputedStyle(grid);
+                        views[tab] = {
+                            category: "all", query: "", items: [], grid: grid, nodes: Object.create(null),
+                            first: -1, last: -1, columns: 0, rowHeight: ROW_HEIGHT,
+                            gap: parseFloat(style.rowGap) || 0,
+                            padTop: parseFloat(style.paddingTop) || 0,
+                            padBottom: parseFloat(style.paddingBottom) || 0,
+                            count: content.querySelector(".results-count")
+                        };
+                        refresh(tab);
+                    })(grids[i]);
+                }
+                window.addEventListener("scroll", scheduleUpdate, {passive: true});
+                window.addEventListener("resize", scheduleUpdate);
                 document.querySelector(".tablinks").click();
             });
             </script>
@@ -1019,274 +2064,35 @@ def scrape_zataz(output_title=None):
             <div class="container">
                 <h1>Veille Technologique</h1>
                 
-                <div class="tab">
-                    <button class="tablinks active" onclick="openTab(event, 'zataz')">ZATAZ</button>
-                    <button class="tablinks" onclick="openTab(event, 'itconnect')">IT Connect</button>
+                <div class="tab">"""
+
+# Onglets des sites du registre (render_tabs) : bouton de la barre d'onglets, puis contenu de
+# l'onglet avec un bouton de filtre par section
+TAB_BUTTON = """
+                    <button class="tablinks{active}" onclick="openTab(event, '{site}')">{title}</button>"""
+
+TAB_BAR_FOOT = """
                     <button class="tablinks" onclick="openTab(event, 'youtube')">Chaînes Youtube</button>
-                </div>
+                </div>"""
+
+SITE_TAB_HEAD = """
 
-                <div id="zataz" class="content active">
+                <div id="{site}" class="content{active}">
                     <div class="subcategories">
-                        <button class="subcategory active" onclick="filterCategory('all', this)">Tous</button>
-                        <button class="subcategory" onclick="filterCategory('cybersecurity', this)">Cybersécurité</button>
-                        <button class="subcategory" onclick="filterCategory('darkweb', this)">Dark Web</button>
-                        <button class="subcategory" onclick="filterCategory('osint', this)">OSINT</button>
-                    </div>
-                    <div class="articles-grid">"""
+                        <button class="subcategory active" onclick="filterCategory('all', this)">Tous</button>"""
 
-        # Scraping des différentes sections
-        cybersecurity_articles = scrape_zataz_section('https://www.zataz.com/category/secu/', 'cybersecurity')
-        darkweb_articles = scrape_zataz_section('https://www.zataz.com/category/actualites/internet-clandestin-darknet/', 'darkweb')
-        osint_articles = scrape_zataz_section('https://www.zataz.com/osint/', 'osint')
-        
-        # Scraping IT-Connect
-        itconnect_courses = scrape_itconnect_courses('https://www.it-connect.fr/cours-it-gratuits/')
-        sysadmin_articles = scrape_itconnect_sysadmin('https://www.it-connect.fr/cours-tutoriels/administration-systemes/')
-        netadmin_articles = scrape_itconnect_netadmin('https://www.it-connect.fr/cours-tutoriels/administration-reseau/')
-        cybersec_articles = scrape_itconnect_cybersec('https://www.it-connect.fr/cours-tutoriels/securite-informatique/')
-        cybernews_articles = scrape_itconnect_cybernews('https://www.it-connect.fr/actualites/actu-securite/')
-        webnews_articles = scrape_itconnect_webnews('https://www.it-connect.fr/actualites/actu-internet/')
-        osnews_articles = scrape_itconnect_osnews('https://www.it-connect.fr/actualites/actu-logiciel-os/')
-        hardnews_articles = scrape_itconnect_hardnews('https://www.it-connect.fr/actualites/actu-materiel/')
-        mobilenews_articles = scrape_itconnect_mobilenews('https://www.it-connect.fr/actualites/actu-mobile/')
-        deals_articles = scrape_itconnect_deals('https://www.it-connect.fr/bons-plans-high-tech/')
-
-        # Ajout des articles Zataz
-        for article in cybersecurity_articles + darkweb_articles + osint_articles:
-            html_content += f"""
-                <div class="article" data-category="{article['category']}">
-                    <div class="article-content">
-                        <div class="article-category">{article['category'].upper()}</div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <p class="description">{article['contenu'][:200]}...</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'article</a>
+CATEGORY_BUTTON = """
+                        <button class="subcategory" onclick="filterCategory('{category}', this)">{label}</button>"""
+
+SITE_TAB_FOOT = """
                     </div>
+                    <input type="search" class="search" placeholder="Rechercher un article..." oninput="searchArticles('{site}', this.value)">
+                    <p class="results-count"></p>
+                    <div class="articles-grid" data-tab="{site}"></div>
                 </div>"""
 
-        # Fermeture de la section Zataz
-        html_content += """
-            </div>
-        </div>"""
-
-        # Partie IT-Connect
-        html_content += """
-        <div id="itconnect" class="content">
-            <div class="subcategories">
-                <button class="subcategory active" onclick="filterCategory('all', this)">Tous</button>
-                <button class="subcategory" onclick="filterCategory('courses', this)">Cours IT</button>
-                <button class="subcategory" onclick="filterCategory('sysadmin', this)">Cours SysAdmin</button>
-                <button class="subcategory" onclick="filterCategory('netadmin', this)">Cours NetAdmin</button>
-                <button class="subcategory" onclick="filterCategory('cybersec', this)">Cours Cybersécurité</button>
-                <button class="subcategory" onclick="filterCategory('cybernews', this)">Actu Cybersécurité</button>
-                <button class="subcategory" onclick="filterCategory('webnews', this)">Actu Web</button>
-                <button class="subcategory" onclick="filterCategory('osnews', this)">Actu OS</button>
-                <button class="subcategory" onclick="filterCategory('hardnews', this)">Actu Hardware</button>
-                <button class="subcategory" onclick="filterCategory('mobilenews', this)">Actu Mobile</button>
-                <button class="subcategory" onclick="filterCategory('deals', this)">Bons Plans Tech</button>
-            </div>
-            <div class="articles-grid">"""
-
-        # Ajout des articles IT-Connect
-        if itconnect_courses:  # Vérifie si des cours ont été trouvés
-            for article in itconnect_courses:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="chapters">{article['chapters']}</div>
-                        <a href="{article['lien']}" class="lien" target="_blank">Voir le cours</a>
-                    </div>"""
-
-        # Ajout des articles SysAdmin
-        if sysadmin_articles:  # Vérifie si des articles ont été trouvés
-            for article in sysadmin_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'article</a>
-                    </div>"""
-
-        # Ajout des articles NetAdmin
-        if netadmin_articles:  # Vérifie si des articles ont été trouvés
-            for article in netadmin_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="subcategory-tag">{article['subcategory']}</div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'article</a>
-                    </div>"""
-
-        # Ajout des articles Cybersécurité
-        if cybersec_articles:  # Vérifie si des articles ont été trouvés
-            for article in cybersec_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="tags">
-                            {' '.join([f'<span class="tag">{tag}</span>' for tag in article['tags']])}
-                        </div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'article</a>
-                    </div>"""
-
-        # Ajout des actualités Cybersécurité
-        if cybernews_articles:
-            for article in cybernews_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'actualité</a>
-                    </div>"""
-
-        # Ajout des actualités Web
-        if webnews_articles:
-            for article in webnews_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                            <span class="comments">{article['comments']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'actualité</a>
-                    </div>"""
-
-        # Ajout des actualités OS
-        if osnews_articles:
-            for article in osnews_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="tags">
-                            {' '.join([f'<span class="tag">{tag}</span>' for tag in article['tags']])}
-                        </div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'actualité</a>
-                    </div>"""
-
-        # Ajout des actualités Hardware
-        if hardnews_articles:
-            for article in hardnews_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                            <span class="comments">{article['comments']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="tags">
-                            {' '.join([f'<span class="tag">{tag}</span>' for tag in article['tags']])}
-                        </div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'actualité</a>
-                    </div>"""
-
-        # Ajout des actualités Mobile
-        if mobilenews_articles:
-            for article in mobilenews_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                            <span class="comments">{article['comments']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="categories">
-                            {' '.join([f'<span class="category-tag">{cat}</span>' for cat in article['categories']])}
-                        </div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Lire l'actualité</a>
-                    </div>"""
-
-        # Ajout des bons plans
-        if deals_articles:
-            for article in deals_articles:
-                html_content += f"""
-                    <div class="article" data-category="{article['category']}">
-                        <div class="article-image">
-                            <a href="{article['lien']}" target="_blank">
-                                <img src="{article['image_url']}" alt="{article['image_alt']}" loading="lazy">
-                            </a>
-                        </div>
-                        <div class="article-meta">
-                            <span class="date">{article['date']}</span>
-                            <span class="author">Par {article['author']}</span>
-                            <span class="comments">{article['comments']}</span>
-                        </div>
-                        <h2 class="titre">{article['titre']}</h2>
-                        <div class="tags">
-                            {' '.join([f'<span class="deal-tag">{tag}</span>' for tag in article['tags']])}
-                        </div>
-                        <p class="description">{article['description']}</p>
-                        <a href="{article['lien']}" class="lien" target="_blank">Voir le bon plan</a>
-                    </div>"""
-
-        # Fermeture de la section IT-Connect et du document
-        html_content += """
-            </div>
-        </div>"""
-
-        # Ajout de la section YouTube après IT Connect
-        html_content += """
+# Onglet des chaînes YouTube
+YOUTUBE_TAB = """
         <div id="youtube" class="content">
             <h1 class="section-title">Chaînes YouTube Tech</h1>
             <div class="youtube-channels">
@@ -1382,119 +2188,774 @@ def scrape_zataz(output_title=None):
             </div>
         </div>"""
 
-        # Ajout du CSS pour la section YouTube
-        css_content = """
-        /* Styles pour les articles ZATAZ */
-        .article-content {
-            padding: 1.5rem;
-            display: flex;
-            flex-direction: column;
-            height: 100%;
-            position: relative;
-            background: linear-gradient(145deg, #ffffff 0%, #f8f9fa 100%);
-        }
-
-        .article-category {
-            display: inline-block;
-            padding: 0.4rem 0.8rem;
-            background: #00b894;
-            color: white;
-            border-radius: 4px;
-            font-size: 0.8rem;
-            font-weight: 500;
-            margin-bottom: 1rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        .article .description {
-            color: #636e72;
-            line-height: 1.6;
-            margin: 1rem 0;
-            flex-grow: 1;
-        }
-
-        /* Styles pour la section YouTube */
-        .youtube-channels {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 2rem;
-            padding: 2rem;
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-
-        .section-title {
-            text-align: center;
-            color: #2d3436;
-            margin: 2rem 0;
-            font-size: 2.5rem;
-            font-weight: 600;
-        }
-
-        .channel-card {
-            height: 100%;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .channel-content {
-            display: flex;
-            flex-direction: column;
-            height: 100%;
-            justify-content: space-between;
-        }
-
-        .channel-description {
-            flex-grow: 1;
-        }
-
-        .channel-link {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            color: #00b894;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 1.1rem;
-            transition: all 0.3s ease;
+REPORT_FOOT = """
+            </div>
+        </body>
+        </html>
+"""
+
+def report_sections():
+    # Ce que le rendu côté navigateur doit savoir de chaque section : onglet, type de carte, libellés
+    return {
+        section: {
+            'tab': source['site'],
+            'card': SCRAPERS[source['scraper']][1],
+            'link_label': source['link_label'],
+            'tag_class': source['tag_class'],
         }
+        for section, source in SOURCE_REGISTRY.items()
+    }
 
-        .channel-link:hover {
-            color: #00a884;
-        }
+def render_tabs():
+    # Un onglet par site ayant au moins une section dans le registre, dans l'ordre du registre
+    sites = list(dict.fromkeys(source['site'] for source in SOURCE_REGISTRY.values()))
+    parts = [
+        TAB_BUTTON.format(site=site, title=escape(SITES[site]['title']), active=' active' if not i else '')
+        for i, site in enumerate(sites)
+    ]
+    parts.append(TAB_BAR_FOOT)
+    for i, site in enumerate(sites):
+        parts.append(SITE_TAB_HEAD.format(site=site, active=' active' if not i else ''))
+        parts.extend(
+            CATEGORY_BUTTON.format(category=section, label=escape(source['label']))
+            for section, source in SOURCE_REGISTRY.items() if source['site'] == site
+        )
+        parts.append(SITE_TAB_FOOT.format(site=site))
+    return ''.join(parts)
+
+def script_json(value):
+    # JSON compact sans risque de fermer la balise <script> qui le contient
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+def write_report(output_file, results):
+    # Le rapport est écrit au fil de l'eau puis renommé. Les articles sont embarqués
+    # en JSON, un par un : le navigateur construit les cartes à la demande.
+    def write(f):
+        f.write(REPORT_HEAD)
+        f.write(render_tabs())
+        f.write(YOUTUBE_TAB)
+        f.write('\n        <script type="application/json" id="articles-data">')
+        f.write('{"sections":' + script_json(report_sections()) + ',"articles":[')
+        first = True
+        for section in REPORT_ORDER:
+            for article in results[section]:
+                if not first:
+                    f.write(',\n')
+                f.write(script_json(article.to_dict()))
+                first = False
+        f.write(']}</script>')
+        f.write(REPORT_FOOT)
+    write_atomically(output_file, write)
+
+# Images des cartes : copies locales nommées par l'empreinte de leur contenu, et miniatures
+# (largeurs en pixels) pour le srcset. Le dossier est relatif à celui du rapport.
+DEFAULT_IMAGES_DIR = 'images'
+IMAGE_WORKERS = 8
+THUMBNAIL_WIDTHS = (400, 800)
+THUMBNAIL_QUALITY = 80
+
+def make_thumbnails(path, digest, images_dir):
+    # Miniatures WebP (JPEG si Pillow n'a pas WebP) : largeur -> nom de fichier.
+    # Pillow est facultatif : sans lui, le rapport utilise l'image d'origine.
+    try:
+        from PIL import Image, features
+    except ImportError:
+        return {}
+    image_format, extension = ('WEBP', '.webp') if features.check('webp') else ('JPEG', '.jpg')
+    variants = {}
+    with Image.open(path) as image:
+        for width in THUMBNAIL_WIDTHS:
+            if image.width <= width:
+                break
+            name = f'{digest}-{width}{extension}'
+            target = os.path.join(images_dir, name)
+            if not os.path.exists(target):
+                thumbnail = image.copy()
+                thumbnail.thumbnail((width, width * image.height // image.width + 1))
+                if thumbnail.mode not in ('RGB', 'L') and image_format == 'JPEG':
+                    thumbnail = thumbnail.convert('RGB')
+                write_atomically(target, lambda f: thumbnail.save(f, image_format, quality=THUMBNAIL_QUALITY), 'wb')
+            variants[width] = name
+    return variants
+
+def fetch_image(url, images_dir):
+    try:
+        response = make_request(url, use_cache=False)
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+        if content_type and not content_type.startswith('image/'):
+            raise ValueError(f"type de contenu inattendu : {content_type}")
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        extension = (mimetypes.guess_extension(content_type) if content_type else None) \
+            or os.path.splitext(urlparse(url).path)[1] or '.img'
+        name = digest + extension
+        path = os.path.join(images_dir, name)
+        # Même contenu sous une autre adresse : le fichier existe déjà
+        if not os.path.exists(path):
+            write_atomically(path, lambda f: f.write(data), 'wb')
+        try:
+            variants = make_thumbnails(path, digest, images_dir)
+        except Exception as e:
+            print(f"Miniatures impossibles pour l'image {url}: {str(e)}")
+            variants = {}
+        return {'file': name, 'variants': variants}
+    except Exception as e:
+        print(f"Erreur lors du téléchargement de l'image {url}: {str(e)}")
+        return None
 
-        .channel-link .arrow {
-            transition: transform 0.3s ease;
+def localize_images(results, images_dir, base_dir=''):
+    # Télécharge en parallèle les images des cartes qui ne sont pas encore en cache, puis fait
+    # pointer les cartes vers les copies locales. index.json retient adresse -> fichier d'une exécution
+    # à l'autre : une image n'est jamais téléchargée deux fois. images_dir est relatif à base_dir,
+    # le dossier du rapport, pour que les cartes y fassent référence par un chemin relatif.
+    prefix = images_dir.replace(os.sep, '/').rstrip('/') + '/'
+    images_dir = os.path.join(base_dir, images_dir)
+    os.makedirs(images_dir, exist_ok=True)
+    index_path = os.path.join(images_dir, 'index.json')
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+
+    urls = dict.fromkeys(
+        article.image_url for articles in results.values() for article in articles
+        if article.image_url and urlparse(article.image_url).scheme in ('http', 'https')
+    )
+    missing = [url for url in urls
+               if url not in index or not os.path.exists(os.path.join(images_dir, index[url]['file']))]
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as executor:
+        for url, entry in zip(missing, executor.map(lambda url: fetch_image(url, images_dir), missing)):
+            if entry is not None:
+                index[url] = entry
+    write_atomically(index_path, lambda f: json.dump(index, f, ensure_ascii=False))
+    print(f"Images : {len(urls)} au total, {len(missing)} à télécharger")
+
+    for articles in results.values():
+        for article in articles:
+            entry = index.get(article.image_url)
+            if entry is None:
+                continue
+            article.image_local = prefix + entry['file']
+            if entry['variants']:
+                article.image_srcset = ', '.join(
+                    f"{prefix}{name} {width}w" for width, name in sorted(entry['variants'].items(), key=lambda v: int(v[0]))
+                )
+
+# Registre des sources (sources.toml) : sites affichés en onglets et sections récupérées, avec
+# leur adresse, leur extracteur, leur rythme en mode watch et leur profondeur de pagination.
+# Ajouter une catégorie revient à ajouter une entrée [[sources]] au fichier.
+DEFAULT_SOURCES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sources.toml')
+
+# Extracteurs utilisables par une source : fonction de scraping et type de carte du rapport
+SCRAPERS = {
+    'zataz': (scrape_zataz_section, 'zataz'),
+    'zataz-osint': (scrape_zataz_section, 'zataz'),
+    'itconnect': (scrape_itconnect_section, 'itconnect'),
+}
+
+# Identifiants de site et de section : repris tels quels dans le HTML et le JavaScript du rapport
+SOURCE_ID = re.compile(r'[A-Za-z0-9_-]+')
+
+# Tables dérivées du registre par configure_sources, lues par les scrapers, le mode watch et le rapport
+SITES = {}               # site -> titre de l'onglet, libellé du lien par défaut
+SOURCE_REGISTRY = {}     # section -> entrée du registre, dans l'ordre du fichier
+SECTIONS = {}            # section -> (fonction de scraping, url de la première page)
+ITCONNECT_SECTIONS = {}  # section -> conteneur et extracteur des cartes IT-Connect (itconnect_section)
+SECTION_INTERVALS = {}   # section -> intervalle propre en mode watch, en secondes
+SECTION_MAX_PAGES = {}   # section -> profondeur maximale de pagination
+FEEDLESS_SECTIONS = set()  # sections sans flux RSS / Atom
+REPORT_ORDER = ()
+
+# Durées du registre et du mode watch : unités reconnues, en secondes
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'j': 86400}
+
+def parse_duration(value):
+    # « 90 », « 90s », « 10m », « 6h », « 1d » (ou « 1j ») -> secondes
+    value = value.strip().lower()
+    unit = DURATION_UNITS.get(value[-1:])
+    number = value[:-1] if unit else value
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise ValueError(f"Durée invalide : {value} (exemples : 90, 10m, 6h, 1d)")
+    if seconds <= 0:
+        raise ValueError(f"Durée invalide : {value}")
+    return seconds
+
+def positive_int(value):
+    # Nombre de pages de --pages : au moins 1, sinon argparse refuse la valeur
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"Nombre invalide : {value} (au moins 1)")
+    return number
+
+def load_sources(path=DEFAULT_SOURCES_FILE):
+    # Lit et vérifie le registre : renvoie (sites, sections). ValueError si une entrée est incomplète
+    # ou incohérente, en nommant la section en cause.
+    with open(path, 'rb') as f:
+        try:
+            config = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"{path} : {e}")
+
+    sites = {}
+    for site, entry in config.get('sites', {}).items():
+        if not SOURCE_ID.fullmatch(site):
+            raise ValueError(f"{path} : identifiant de site invalide : {site}")
+        sites[site] = {
+            'title': entry.get('title', site),
+            'link_label': entry.get('link_label', "Lire l'article"),
         }
 
-        .channel-link:hover .arrow {
-            transform: translateX(5px);
+    sources = {}
+    for entry in config.get('sources', []):
+        section = entry.get('category', '')
+        where = f"{path} : section {section or '?'}"
+        missing = [key for key in ('site', 'category', 'url', 'scraper') if not entry.get(key)]
+        if missing:
+            raise ValueError(f"{where} : champ(s) manquant(s) : {', '.join(missing)}")
+        if not SOURCE_ID.fullmatch(section):
+            raise ValueError(f"{where} : identifiant de section invalide")
+        if section in sources:
+            raise ValueError(f"{where} : section déjà déclarée")
+        if entry['site'] not in sites:
+            raise ValueError(f"{where} : site inconnu : {entry['site']} ({', '.join(sites)})")
+        if entry['scraper'] not in SCRAPERS:
+            raise ValueError(f"{where} : extracteur inconnu : {entry['scraper']} ({', '.join(SCRAPERS)})")
+        pages = entry.get('pages')
+        if pages is not None and (not isinstance(pages, int) or pages < 1):
+            raise ValueError(f"{where} : pages doit être un entier supérieur ou égal à 1")
+        try:
+            interval = parse_duration(str(entry['interval'])) if 'interval' in entry else None
+        except ValueError as e:
+            raise ValueError(f"{where} : {e}")
+
+        source = {
+            'site': entry['site'],
+            'label': entry.get('label', section),
+            'url': entry['url'],
+            'scraper': entry['scraper'],
+            'interval': interval,
+            'pages': pages,
+            'feed': entry.get('feed', True),
+            'link_label': entry.get('link_label', sites[entry['site']]['link_label']),
+            'tag_class': entry.get('tag_class', 'tag'),
+            # Empreinte de ce qui détermine les articles extraits (voir articles_key)
+            'digest': hashlib.sha256(json.dumps(
+                [entry['scraper'], entry.get('container'), entry.get('fields')]).encode()).hexdigest()[:16],
         }
-        """
-
-        # Insérer le CSS dans le head du document
-        html_content = html_content.replace('</style>', f'{css_content}</style>')
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
+        if source['scraper'] == 'itconnect':
+            name, _, class_name = entry.get('container', '').partition('.')
+            fields = entry.get('fields', [])
+            if not name or not class_name:
+                raise ValueError(f"{where} : container doit être de la forme balise.classe")
+            unknown = [field for field in fields if field not in ITCONNECT_FIELDS]
+            if unknown:
+                raise ValueError(f"{where} : champ(s) inconnu(s) : {', '.join(unknown)} ({', '.join(ITCONNECT_FIELDS)})")
+            # Une carte sans lien vers l'article n'est pas exploitable (parse_itconnect_cards)
+            if 'lien' not in fields:
+                raise ValueError(f"{where} : fields doit contenir lien")
+            source['spec'] = itconnect_section((name, class_name), tuple(fields), entry.get('error_label', section),
+                                               source['link_label'], source['tag_class'])
+        sources[section] = source
+
+    if not sources:
+        raise ValueError(f"{path} : aucune source déclarée")
+    return sites, sources
+
+def select_sources(sources, only):
+    # only : « site » (toutes ses sections) ou « site:section », l'ordre du registre est conservé
+    selected = set()
+    for choice in only:
+        site, _, section = choice.partition(':')
+        matching = [name for name, source in sources.items()
+                    if source['site'] == site and (not section or name == section)]
+        if not matching:
+            available = ', '.join(f"{source['site']}:{name}" for name, source in sources.items())
+            raise ValueError(f"Source inconnue : {choice} ({available})")
+        selected.update(matching)
+    return {name: source for name, source in sources.items() if name in selected}
+
+def configure_sources(path=DEFAULT_SOURCES_FILE, only=None):
+    # Installe le registre (restreint aux choix de --only) dans les tables lues par le reste du programme
+    global REPORT_ORDER
+    sites, sources = load_sources(path)
+    if only:
+        sources = select_sources(sources, only)
+    SITES.clear()
+    SITES.update(sites)
+    SOURCE_REGISTRY.clear()
+    SOURCE_REGISTRY.update(sources)
+    SECTIONS.clear()
+    SECTIONS.update({name: (SCRAPERS[source['scraper']][0], source['url']) for name, source in sources.items()})
+    ITCONNECT_SECTIONS.clear()
+    ITCONNECT_SECTIONS.update({name: source['spec'] for name, source in sources.items() if 'spec' in source})
+    SECTION_INTERVALS.clear()
+    SECTION_INTERVALS.update({name: source['interval'] for name, source in sources.items() if source['interval']})
+    SECTION_MAX_PAGES.clear()
+    SECTION_MAX_PAGES.update({name: source['pages'] for name, source in sources.items() if source['pages']})
+    FEEDLESS_SECTIONS.clear()
+    FEEDLESS_SECTIONS.update(name for name, source in sources.items() if not source['feed'])
+    REPORT_ORDER = tuple(sources)
+    return sources
+
+# Registre par défaut chargé dès l'import : les processus d'analyse (--parse-workers) en ont besoin.
+# Un fichier illisible est signalé au lancement, quand la ligne de commande le recharge.
+try:
+    configure_sources()
+except (OSError, ValueError):
+    pass
+
+
+# Formats de sortie : le rapport HTML et des exports structurés pour les outils d'analyse
+EXPORT_FORMATS = ('html', 'jsonl', 'csv', 'parquet')
+
+# Schéma stable des exports : tous les champs d'Article sont présents pour chaque article,
+# vides (None ou liste vide) lorsque la section ne fournit pas le champ
+EXPORT_FIELDS = ARTICLE_FIELDS
+EXPORT_LIST_FIELDS = ('sections', 'tags', 'categories')
+
+# Séparateur des valeurs multiples dans une cellule CSV
+CSV_LIST_SEPARATOR = ' | '
+
+# Nombre de lignes par groupe de lignes Parquet
+PARQUET_BATCH_SIZE = 1000
+
+def export_rows(results):
+    for section in REPORT_ORDER:
+        for article in results[section]:
+            row = {}
+            for field in EXPORT_FIELDS:
+                value = getattr(article, field)
+                if field in EXPORT_LIST_FIELDS:
+                    value = list(value) if value else []
+                row[field] = value
+            if not row['sections']:
+                row['sections'] = [row['category']]
+            yield row
+
+def write_jsonl(output_file, results):
+    def write(f):
+        for row in export_rows(results):
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write('\n')
+    write_atomically(output_file, write)
+
+def write_csv(output_file, results):
+    def write(f):
+        writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        for row in export_rows(results):
+            for field in EXPORT_LIST_FIELDS:
+                row[field] = CSV_LIST_SEPARATOR.join(row[field])
+            writer.writerow(row)
+    # utf-8-sig : Excel reconnaît ainsi l'encodage des accents
+    write_atomically(output_file, write, newline='', encoding='utf-8-sig')
+
+def write_parquet(output_file, results):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("L'export Parquet nécessite pyarrow (pip install pyarrow)")
+
+    schema = pa.schema([
+        (field, pa.list_(pa.string()) if field in EXPORT_LIST_FIELDS else pa.string())
+        for field in EXPORT_FIELDS
+    ])
+
+    def write(f):
+        with pq.ParquetWriter(f, schema) as writer:
+            batch = []
+            for row in export_rows(results):
+                batch.append(row)
+                if len(batch) == PARQUET_BATCH_SIZE:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    write_atomically(output_file, write, 'wb')
+
+EXPORT_WRITERS = {
+    'html': write_report,
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+    'parquet': write_parquet,
+}
+
+def write_outputs(output_base, results, formats=('html',), images_dir=None):
+    # Dédoublonnage, images locales puis un fichier par format : output_base.html, output_base.jsonl...
+    results = dedupe_articles(results, REPORT_ORDER)
+    if images_dir:
+        localize_images(results, images_dir, os.path.dirname(output_base))
+    output_files = []
+    for output_format in dict.fromkeys(formats):
+        output_file = f'{output_base}.{output_format}'
+        start = time.perf_counter()
+        EXPORT_WRITERS[output_format](output_file, results)
+        metrics.record_render(output_format, time.perf_counter() - start)
+        output_files.append(output_file)
         print(f"Le rapport a été généré dans le fichier: {output_file}")
-        return output_file
+    return output_files
+
+def scrape_zataz(output_title=None, max_workers=MAX_WORKERS, store=None, incremental=False, merge=False,
+                 max_pages=1, since=None, formats=('html',), metrics_file=None, source='html', images_dir=None):
+    # store : historique des articles ; incremental : ne garder que les nouveaux articles ;
+    # merge : ajouter à ces nouveaux articles ceux des exécutions précédentes ;
+    # max_pages / since : profondeur de pagination et date de publication la plus ancienne ;
+    # formats : fichiers générés, parmi EXPORT_FORMATS ; metrics_file : mesures de l'exécution (.json ou Prometheus) ;
+    # source : 'html' (pages des sites) ou 'feed' (flux RSS / Atom, la page HTML pour les sections sans flux) ;
+    # images_dir : copie locale des images des cartes, relative au dossier du rapport (None : images distantes)
+    metrics.reset()
+    try:
+        # Gestion du nom des fichiers de sortie (une extension par format)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if output_title:
+            output_base = output_title
+        else:
+            output_base = f'articles_{timestamp}'
+
+        # En mode incrémental, les cartes dont le lien est déjà connu ne sont pas analysées
+        known = store.known if store is not None and incremental else None
+
+        # Scraping de toutes les sections en parallèle
+        tasks = feed_tasks(SECTIONS) if source == 'feed' else SECTIONS
+        results = run_sections(tasks, max_workers, known, max_pages, since)
+
+        if store is not None:
+            previous = {section: store.load(section) for section in results} if merge else {}
+            new_count = 0
+            for section, articles in results.items():
+                new_articles = store.record(articles)
+                new_count += len(new_articles)
+                if incremental:
+                    results[section] = new_articles + previous.get(section, [])
+            print(f"{new_count} nouvel(s) article(s) depuis la dernière exécution")
+
+        output_files = write_outputs(output_base, results, formats, images_dir)
+
+        metrics.print_summary(REPORT_ORDER)
+        if metrics_file:
+            metrics.write(metrics_file)
+        return output_files
             
     except Exception as e:
         print(f"Erreur lors du scraping: {str(e)}")
         return None
 
+# Mode watch : intervalle de rafraîchissement par défaut (actualités), en secondes. Les sections
+# qui changent rarement ont leur propre intervalle dans le registre (SECTION_INTERVALS).
+DEFAULT_WATCH_INTERVAL = 600
+
+def watch(output_title=None, intervals=None, default_interval=DEFAULT_WATCH_INTERVAL, max_workers=MAX_WORKERS,
+          store=None, max_pages=1, since=None, formats=('html',), metrics_file=None, source='html',
+          images_dir=None, cycles=None):
+    # Reste en mémoire : client HTTP, connexions et caches restent chauds d'un cycle à l'autre.
+    # Chaque section est rafraîchie à son propre rythme (intervals, sinon SECTION_INTERVALS, sinon
+    # default_interval) et le rapport n'est régénéré que si une section a changé.
+    # cycles : nombre de cycles avant de rendre la main (None : sans fin)
+    output_base = output_title or 'articles'
+    tasks = feed_tasks(SECTIONS) if source == 'feed' else SECTIONS
+    intervals = {**SECTION_INTERVALS, **(intervals or {})}
+    results = {section: [] for section in tasks}
+    signatures = {}
+    next_run = dict.fromkeys(tasks, 0)
+    cycle = 0
+    while cycles is None or cycle < cycles:
+        now = time.monotonic()
+        due = [section for section in tasks if next_run[section] <= now]
+        if not due:
+            time.sleep(min(next_run.values()) - now)
+            continue
+        cycle += 1
+        for section in due:
+            next_run[section] = now + intervals.get(section, default_interval)
+        metrics.reset()
+        try:
+            fresh = run_sections({section: tasks[section] for section in due}, max_workers, None, max_pages, since)
+            changed = []
+            for section in due:
+                articles = fresh[section]
+                # Une section en erreur garde ses articles précédents au lieu de disparaître du rapport
+                if not articles and metrics.sections.get(section, {}).get('errors'):
+                    continue
+                signature = [article.to_dict() for article in articles]
+                if signature != signatures.get(section):
+                    signatures[section] = signature
+                    results[section] = articles
+                    changed.append(section)
+
+            clock = datetime.now().strftime('%H:%M:%S')
+            if store is not None and changed:
+                new_count = sum(len(store.record(fresh[section])) for section in changed)
+                print(f"[{clock}] {new_count} nouvel(s) article(s)")
+            if changed:
+                print(f"[{clock}] Sections modifiées : {', '.join(changed)}")
+                write_outputs(output_base, results, formats, images_dir)
+            else:
+                print(f"[{clock}] Aucun changement ({', '.join(due)})")
+            metrics.print_summary(REPORT_ORDER)
+            if metrics_file:
+                metrics.write(metrics_file)
+        except Exception as e:
+            print(f"Erreur lors du scraping: {str(e)}")
+
+# Pages du banc d'essai hors ligne : une par section, plus une page intégrée OSINT. Celles du dépôt
+# sont synthétiques (structure des cartes des sites, taille gonflée par des balises de remplissage) ;
+# bench --record les remplace par les pages en ligne.
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+OSINT_EMBED_FIXTURE = 'osint_embed'
+
+# Écart toléré (en %) avec les mesures de référence avant de signaler un ralentissement
+DEFAULT_BENCH_TOLERANCE = 20
+
+def parse_fixture(name, markup, backend):
+    # Même analyse que les scrapers, sans réseau ni cache, avec le moteur demandé
+    if name == OSINT_EMBED_FIXTURE:
+        article = parse_osint_embed(markup, backend)
+        return [article] if article else []
+    return parse_listing(name, markup, backend)
+
+def record_fixtures(fixtures_dir=DEFAULT_FIXTURES_DIR):
+    # Enregistre la première page de chaque section (et une page intégrée OSINT) depuis les sites
+    os.makedirs(fixtures_dir, exist_ok=True)
+    pages = {}
+    for name, (_, url) in SECTIONS.items():
+        pages[name] = make_request(url).text
+    embedded = [name for name in pages if SOURCE_REGISTRY[name]['scraper'] == 'zataz-osint']
+    sources = osint_sources(make_soup(pages[embedded[0]], OSINT_STRAINER)) if embedded else []
+    if sources:
+        pages[OSINT_EMBED_FIXTURE] = make_request(urldefrag(sources[0])[0]).text
+    for name, markup in pages.items():
+        path = os.path.join(fixtures_dir, f'{name}.html')
+        write_atomically(path, lambda f: f.write(markup))
+        print(f"Page enregistrée : {path}")
+
+def benchmark(fixtures_dir=DEFAULT_FIXTURES_DIR, backends=None, repeat=20):
+    # Pour chaque moteur et chaque page : pages et articles analysés par seconde, et pic de mémoire
+    # allouée pendant une analyse (tracemalloc, mesuré à part pour ne pas fausser les temps)
+    backends = backends or [name for name in PARSER_BACKENDS[1:] if builder_registry.lookup(name)]
+    names = list(SECTIONS) + [OSINT_EMBED_FIXTURE]
+    fixtures = {}
+    for name in names:
+        path = os.path.join(fixtures_dir, f'{name}.html')
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                fixtures[name] = f.read()
+    if not fixtures:
+        raise FileNotFoundError(f"Aucune page enregistrée dans {fixtures_dir} (bench --record pour les créer)")
+
+    results = []
+    for backend in backends:
+        resolve_parser_backend(backend)
+        for name, markup in fixtures.items():
+            articles = len(parse_fixture(name, markup, backend))
+            start = time.perf_counter()
+            for _ in range(repeat):
+                parse_fixture(name, markup, backend)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            parse_fixture(name, markup, backend)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append({
+                'backend': backend,
+                'page': name,
+                'bytes': len(markup.encode('utf-8')),
+                'articles': articles,
+                'pages_per_second': repeat / elapsed,
+                'articles_per_second': repeat * articles / elapsed,
+                'peak_memory_bytes': peak,
+            })
+    return results
+
+def print_benchmark(results, baseline=None, tolerance=DEFAULT_BENCH_TOLERANCE):
+    # baseline : résultats d'une exécution précédente (--output), renvoie les cas devenus plus lents
+    reference = {(r['backend'], r['page']): r for r in baseline or []}
+    slower = []
+    print(f"{'Moteur':<13}{'Page':<14}{'Ko':>7}{'Articles':>10}{'Pages/s':>10}{'Articles/s':>12}{'Mémoire (Ko)':>14}"
+          + (f"{'Écart':>9}" if reference else ''))
+    for r in results:
+        line = (f"{r['backend']:<13}{r['page']:<14}{r['bytes'] / 1024:>7.1f}{r['articles']:>10}"
+                f"{r['pages_per_second']:>10.1f}{r['articles_per_second']:>12.1f}{r['peak_memory_bytes'] / 1024:>14.1f}")
+        previous = reference.get((r['backend'], r['page']))
+        if previous:
+            change = (r['pages_per_second'] / previous['pages_per_second'] - 1) * 100
+            line += f"{change:>+8.0f}%"
+            if change < -tolerance:
+                slower.append(r)
+                line += ' LENT'
+        print(line)
+    for backend in dict.fromkeys(r['backend'] for r in results):
+        rows = [r for r in results if r['backend'] == backend]
+        elapsed = sum(1 / r['pages_per_second'] for r in rows)
+        print(f"{backend} : {len(rows) / elapsed:.1f} pages/s, "
+              f"{sum(r['articles'] for r in rows) / elapsed:.1f} articles/s sur l'ensemble des pages")
+    return slower
+
 if __name__ == "__main__":
     # Configuration du parser d'arguments
     parser = argparse.ArgumentParser(description='Scraper pour les articles de ZATAZ')
     parser.add_argument('-t', '--title', 
-                        help='Titre du fichier HTML généré (sans extension)',
+                        help='Titre des fichiers générés (sans extension)',
                         default=None)
+    parser.add_argument('-f', '--format', nargs='+', choices=EXPORT_FORMATS, default=['html'],
+                        help='Formats générés : html, jsonl, csv, parquet (plusieurs possibles)')
+    parser.add_argument('-w', '--workers', type=int, default=MAX_WORKERS,
+                        help='Nombre maximum de sections récupérées en parallèle')
+    parser.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE,
+                        help='Nombre de connexions conservées par site')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Délai maximum (en secondes) pour chaque requête HTTP')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='Nombre de requêtes par seconde autorisées par site (0 pour désactiver)')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST,
+                        help='Nombre de requêtes pouvant partir immédiatement vers un même site')
+    parser.add_argument('--retries', type=int, default=DEFAULT_MAX_RETRIES,
+                        help='Nombre maximum de nouvelles tentatives après une erreur temporaire (429, 503, coupure...)')
+    parser.add_argument('--retry-budget', type=float, default=DEFAULT_RETRY_BUDGET,
+                        help='Temps maximum (en secondes) passé à attendre entre les tentatives d\'une requête')
+    parser.add_argument('--breaker-failures', type=int, default=DEFAULT_FAILURE_THRESHOLD,
+                        help="Échecs consécutifs avant de suspendre les requêtes vers un site (0 pour désactiver)")
+    parser.add_argument('--breaker-reset', type=float, default=DEFAULT_RESET_TIMEOUT,
+                        help="Durée (en secondes) de la suspension avant une requête d'essai")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="Processus dédiés à l'analyse HTML (0 : analyse dans les threads de téléchargement)")
+    parser.add_argument('-p', '--parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER_BACKEND,
+                        help="Moteur d'analyse HTML (auto : lxml s'il est installé, sinon html.parser)")
+    parser.add_argument('--sources', default=DEFAULT_SOURCES_FILE, metavar='FICHIER',
+                        help='Registre TOML des sites et sections à récupérer (sources.toml par défaut)')
+    parser.add_argument('--only', action='append', default=[], metavar='SITE[:SECTION]',
+                        help='Limite la veille à un site ou à une section, ex. itconnect:cybernews (répétable)')
+    parser.add_argument('--source', choices=SOURCES, default='html',
+                        help='Lecture des pages HTML ou des flux RSS/Atom des sections (plus légers)')
+    parser.add_argument('--images', nargs='?', const=DEFAULT_IMAGES_DIR, default=None, metavar='DOSSIER',
+                        help="Copie locale des images et miniatures, dans DOSSIER à côté du rapport (images par défaut)")
+    parser.add_argument('--pages', type=positive_int, default=1,
+                        help='Nombre maximum de pages parcourues par section (pagination /page/N/)')
+    parser.add_argument('--since', type=date.fromisoformat, default=None,
+                        help="Ignore les articles publiés avant cette date (AAAA-MM-JJ)")
+    parser.add_argument('--metrics-file', default=None,
+                        help="Écrit les mesures de l'exécution : JSON si le nom finit par .json, sinon format Prometheus")
+    parser.add_argument('--db', default=DEFAULT_DB,
+                        help='Base SQLite des articles déjà vus')
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help="N'affiche que les articles absents des exécutions précédentes")
+    parser.add_argument('--merge', action='store_true',
+                        help='Avec --incremental, ajoute au rapport les articles des exécutions précédentes')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help='Dossier du cache HTTP (ETag / Last-Modified)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Désactive le cache HTTP et retélécharge toutes les pages')
+
+    subparsers = parser.add_subparsers(dest='command')
+    search_parser = subparsers.add_parser('search', help="Recherche dans l'historique des articles")
+    search_parser.add_argument('query', help='Mots recherchés (syntaxe FTS5 acceptée : ransomware AND france)')
+    search_parser.add_argument('-n', '--limit', type=int, default=20,
+                               help='Nombre maximum de résultats')
+    search_parser.add_argument('--db', default=argparse.SUPPRESS,
+                               help='Base SQLite des articles déjà vus')
+    watch_parser = subparsers.add_parser('watch', help='Reste actif et rafraîchit chaque section à son rythme')
+    watch_parser.add_argument('--interval', action='append', default=[], metavar='SECTION=DURÉE',
+                              help='Intervalle propre à une section, ex. courses=1d ou cybernews=5m (répétable)')
+    watch_parser.add_argument('--every', type=parse_duration, default=DEFAULT_WATCH_INTERVAL, metavar='DURÉE',
+                              help='Intervalle des sections sans intervalle propre (10m par défaut)')
+    bench_parser = subparsers.add_parser('bench', help="Mesure la vitesse d'analyse sur des pages enregistrées, hors ligne")
+    bench_parser.add_argument('-p', '--parser', nargs='+', choices=PARSER_BACKENDS[1:], dest='backends',
+                              help='Moteurs comparés (par défaut : tous ceux qui sont installés)')
+    bench_parser.add_argument('-n', '--repeat', type=int, default=20,
+                              help="Nombre d'analyses de chaque page")
+    bench_parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR,
+                              help='Dossier des pages enregistrées')
+    bench_parser.add_argument('--record', action='store_true',
+                              help="Enregistre d'abord les pages actuelles des sites dans le dossier")
+    bench_parser.add_argument('--output', default=None,
+                              help='Écrit les résultats en JSON (pour servir de référence)')
+    bench_parser.add_argument('--baseline', default=None,
+                              help="Résultats JSON de référence : échoue si une page est devenue plus lente")
+    bench_parser.add_argument('--tolerance', type=float, default=DEFAULT_BENCH_TOLERANCE,
+                              help='Ralentissement toléré par rapport à la référence, en %%')
     
     # Parse les arguments
     args = parser.parse_args()
+
+    try:
+        configure_sources(args.sources, [choice for value in args.only for choice in value.split(',') if choice])
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.command == 'search':
+        if not args.query.split():
+            search_parser.error("La recherche ne peut pas être vide")
+        store = ArticleStore(args.db)
+        try:
+            search_articles(store, args.query, args.limit)
+        finally:
+            store.close()
+        raise SystemExit(0)
+
+    if args.command == 'bench':
+        if args.record:
+            configure_http_client(cache_dir=None)
+            record_fixtures(args.fixtures)
+        try:
+            results = benchmark(args.fixtures, args.backends, args.repeat)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        slower = print_benchmark(results, baseline, args.tolerance)
+        if args.output:
+            write_atomically(args.output, lambda f: json.dump(results, f, indent=2))
+        raise SystemExit(1 if slower else 0)
     
+    if args.merge and not args.incremental:
+        parser.error("--merge nécessite -i/--incremental")
+
+    # Dépendance facultative vérifiée avant tout téléchargement plutôt qu'à l'écriture des fichiers
+    if 'parquet' in args.format:
+        try:
+            import pyarrow
+        except ImportError:
+            parser.error("Le format parquet nécessite pyarrow (pip install pyarrow)")
+
+    try:
+        set_parser_backend(args.parser)
+    except ValueError as e:
+        parser.error(str(e))
+    configure_http_client(args.pool_size, args.timeout, rate=args.rate, burst=args.burst,
+                          cache_dir=None if args.no_cache else args.cache_dir,
+                          max_retries=args.retries, retry_budget=args.retry_budget,
+                          failure_threshold=args.breaker_failures, reset_timeout=args.breaker_reset)
+    configure_parse_pool(args.parse_workers, args.sources)
+
+    store = ArticleStore(args.db)
+
+    if args.command == 'watch':
+        intervals = {}
+        for entry in args.interval:
+            section, _, duration = entry.partition('=')
+            if section not in SECTIONS:
+                parser.error(f"Section inconnue : {section} ({', '.join(SECTIONS)})")
+            try:
+                intervals[section] = parse_duration(duration)
+            except ValueError as e:
+                parser.error(str(e))
+        try:
+            watch(args.title, intervals, args.every, args.workers, store, args.pages, args.since, args.format,
+                  args.metrics_file, args.source, args.images)
+        except KeyboardInterrupt:
+            print("Arrêt du mode watch")
+        finally:
+            store.close()
+        raise SystemExit(0)
+
     # Lance le scraping avec le titre spécifié
-    scrape_zataz(args.title)
+    try:
+        scrape_zataz(args.title, args.workers, store, args.incremental, args.merge, args.pages, args.since,
+                     args.format, args.metrics_file, args.source, args.images)
+    finally:
+        store.close()
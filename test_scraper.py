@@ -0,0 +1,32 @@
+# Tests hors ligne sur les pages du dossier fixtures : python -m pytest
+import os
+
+import pytest
+from bs4.builder import builder_registry
+
+import scraper
+
+FIXTURES = sorted(
+    name[:-len('.html')] for name in os.listdir(scraper.DEFAULT_FIXTURES_DIR) if name.endswith('.html')
+)
+
+def read_fixture(name):
+    with open(os.path.join(scraper.DEFAULT_FIXTURES_DIR, f'{name}.html'), encoding='utf-8') as f:
+        return f.read()
+
+@pytest.mark.parametrize('backend', ['html.parser', 'lxml'])
+@pytest.mark.parametrize('name', FIXTURES)
+def test_strainer_matches_full_parse(monkeypatch, name, backend):
+    # Les SoupStrainer ne doivent rien changer aux articles extraits : même résultat qu'avec l'arbre complet
+    if not builder_registry.lookup(backend):
+        pytest.skip(f"{backend} n'est pas installé")
+    markup = read_fixture(name)
+    strained = scraper.parse_fixture(name, markup, backend)
+
+    make_soup = scraper.make_soup
+    monkeypatch.setattr(scraper, 'make_soup',
+                        lambda markup, parse_only=None, backend=None: make_soup(markup, None, backend))
+    full = scraper.parse_fixture(name, markup, backend)
+
+    assert strained
+    assert strained == full